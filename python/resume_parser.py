@@ -9,8 +9,9 @@ import sys
 import json
 import os
 import re
+import functools
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Iterable, Tuple, Optional
 
 # Try to import PDF libraries, but don't fail if not available
 try:
@@ -31,6 +32,79 @@ try:
 except ImportError:
     HAS_PDFPLUMBER = False
 
+# Project entry bullets ("- ", "• ", "1. ") at the start of a section line
+_PROJECT_BULLET_RE = re.compile(r'^[•\-\*\d+\.]\s+')
+
+# Whole-text fallback for project blocks under headings the section split
+# doesn't recognise (e.g. "Research Projects:")
+_PROJECTS_BLOCK_RE = re.compile(
+    r'projects?\s*:?\s*(.*?)(?:experience|skills|education|certification|$)',
+    re.IGNORECASE | re.DOTALL
+)
+_PROJECT_BULLET_TEXT_RE = re.compile(r'(?:^|\n)\s*[•\-\*\d+\.]\s+')
+
+# Leading bullet markers on experience/project lines
+_BULLET_PREFIXES = ('•', '-', '*', '(cid:127)')
+
+
+def _strip_bullet(line: str) -> str:
+    """Drop a single leading bullet marker and surrounding whitespace."""
+    if line.startswith('(cid:127)'):
+        line = line[9:]
+    elif line.startswith(('•', '-', '*')):
+        line = line[1:]
+    return line.strip()
+
+
+# Project title detection: month prefixes and 4-digit years
+_MONTH_PREFIXES = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+_FOUR_DIGIT_RE = re.compile(r'\d{4}')
+
+# Lines starting with these are project description, not titles
+_DESCRIPTION_STARTERS = (
+    'developed', 'built', 'created', 'implemented', 'integrated', 'demonstrated',
+    'used', 'leveraged', 'designed', 'technologies:', 'tech stack:',
+)
+
+
+# ML/NLP method names recognised in project descriptions (output keeps this order)
+_METHOD_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:TF-IDF|TF/IDF|tfidf)',
+        r'(?:Cosine Similarity|cosine similarity)',
+        r'(?:Random Forest|random forest)',
+        r'(?:Logistic Regression|logistic regression)',
+        r'(?:Neural Network|neural networks)',
+        r'(?:Feature Engineering|feature engineering)',
+        r'(?:Hyperparameter Tuning|hyperparameter tuning)',
+        r'(?:Exploratory Data Analysis|EDA)',
+        r'(?:NLP|Natural Language Processing)',
+        r'(?:CNN|Convolutional Neural Network)',
+        r'(?:RNN|Recurrent Neural Network)',
+        r'(?:LSTM|Long Short-Term Memory)',
+    )
+]
+
+# GPA scale -> multiplier onto the 10-point scale
+_CGPA_SCALE_MULTIPLIER = {4.0: 2.5, 5.0: 2.0, 10.0: 1.0}
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_string_cached(s: str) -> str:
+    """Stateless body of ResumeParser._clean_string, memoized for repeated strings."""
+    # Remove leading/trailing bullets
+    bullets = ['\uf0b7', '•', '▪', '▫', '●', '○', '■', '□', '◆', '◇', '-', '–', '—']
+    s = s.strip()
+    for bullet in bullets:
+        s = s.lstrip(bullet).strip()
+    # Normalize separators
+    s = s.replace('—', '-').replace('–', '-')
+    # Remove common PDF artifacts
+    s = s.replace('(cid:127)', '').replace('\ufffd', '')
+    
+    return s.strip()
+
 
 class ResumeParser:
     """Extract structured data from resume files."""
@@ -261,6 +335,12 @@ class ResumeParser:
         'requirements analysis', 'stakeholder management', 'documentation',
     ]
     
+    # Lowercased tool vocabulary for per-project matching (built once, not per project)
+    KNOWN_TOOLS_LOWER = [
+        tool.lower()
+        for tool in FRAMEWORKS_LIBRARIES + PROGRAMMING_LANGUAGES + TOOLS_PLATFORMS + DATABASES
+    ]
+    
     # Education keywords
     EDUCATION_KEYWORDS = {
         'degree': [
@@ -287,7 +367,8 @@ class ResumeParser:
         self.file_path = file_path
         self.text_content = ""
         self.raw_text = ""
-        self._sections_cache: Dict[str, List[str]] = {}
+        self._sections_cache: Optional[Dict[str, List[str]]] = None
+        self._text_lower: Optional[str] = None
     
     def _clean_text(self, text: str) -> str:
         """
@@ -326,18 +407,7 @@ class ResumeParser:
         """Clean individual strings (roles, company names, etc.)"""
         if not s:
             return ""
-        
-        # Remove leading/trailing bullets
-        bullets = ['\uf0b7', '•', '▪', '▫', '●', '○', '■', '□', '◆', '◇', '-', '–', '—']
-        s = s.strip()
-        for bullet in bullets:
-            s = s.lstrip(bullet).strip()
-        # Normalize separators
-        s = s.replace('—', '-').replace('–', '-')
-        # Remove common PDF artifacts
-        s = s.replace('(cid:127)', '').replace('\ufffd', '')
-        
-        return s.strip()
+        return _clean_string_cached(s)
 
     def _detect_section_key(self, line: str) -> Optional[str]:
         """Detect section key based on a heading line."""
@@ -373,9 +443,15 @@ class ResumeParser:
                     return key
         return None
 
+    def _get_text_lower(self) -> str:
+        """Lowercased resume text, computed once and shared by all extractors."""
+        if self._text_lower is None:
+            self._text_lower = self.text_content.lower()
+        return self._text_lower
+
     def _get_sections(self) -> Dict[str, List[str]]:
         """Split resume into sections by detecting headings."""
-        if self._sections_cache:
+        if self._sections_cache is not None:
             return self._sections_cache
 
         sections: Dict[str, List[str]] = {}
@@ -554,7 +630,7 @@ class ResumeParser:
         
         return skill
 
-    def _harvest_skills_from_texts(self, texts: List[str]) -> Dict[str, set]:
+    def _harvest_skills_from_texts(self, texts: Iterable[str]) -> Dict[str, set]:
         """Harvest technical skills from arbitrary text (experience, projects, tech stack)."""
         harvested = {
             'technical_skills': set(),
@@ -564,7 +640,9 @@ class ResumeParser:
             'databases': set(),
         }
 
-        if not texts:
+        # Join for easier matching
+        combined = "\n".join(t for t in texts if t)
+        if not combined:
             return harvested
 
         all_known_skills = (
@@ -574,9 +652,6 @@ class ResumeParser:
             self.DATABASES
         )
 
-        # Join for easier matching
-        combined = "\n".join([t for t in texts if t])
-
         # Match known skills with strict boundaries (avoid prefix-only matches)
         for known_skill in all_known_skills:
             pattern = r'(?<![A-Za-z0-9])' + re.escape(known_skill) + r'(?![A-Za-z0-9])'
@@ -834,7 +909,7 @@ class ResumeParser:
         skills_lines = sections.get('skills', [])
         
         # Full resume text for verbatim check
-        resume_text_lower = self.text_content.lower()
+        resume_text_lower = self._get_text_lower()
         
         text_lower = "\n".join(skills_lines).lower() if skills_lines else resume_text_lower
         
@@ -902,7 +977,7 @@ class ResumeParser:
         RULE: Institution names often on separate line - extract LONGEST meaningful phrase.
         """
         education_list = []
-        text_lower = self.text_content.lower()
+        text_lower = self._get_text_lower()
         
         # Find education section
         education_section_pattern = r'education\s*:?\s*(.*?)(?:experience|skills|projects|certification|professional\s+achievements|internship|declaration|$)'
@@ -911,13 +986,13 @@ class ResumeParser:
         if education_matches:
             education_text = " ".join(education_matches)
             # Extract original text corresponding to education section
-            start_idx = self.text_content.lower().find('education')
+            start_idx = text_lower.find('education')
             if start_idx != -1:
                 # Find end of education section
                 end_keywords = ['experience', 'skill', 'project', 'certification', 'professional', 'internship', 'declaration']
                 end_idx = len(self.text_content)
                 for keyword in end_keywords:
-                    temp_idx = self.text_content.lower().find(keyword, start_idx + 10)
+                    temp_idx = text_lower.find(keyword, start_idx + 10)
                     if temp_idx != -1 and temp_idx < end_idx:
                         end_idx = temp_idx
                 education_text_orig = self.text_content[start_idx:end_idx]
@@ -1060,7 +1135,7 @@ class ResumeParser:
         ✅ IMPROVED: Extract total work experience in months.
         Looks for explicit duration mentions and date ranges.
         """
-        text_lower = self.text_content.lower()
+        text_lower = self._get_text_lower()
         total_months = 0
         
         # Strategy 1: Look for explicit duration mentions
@@ -1217,7 +1292,7 @@ class ResumeParser:
     def extract_certifications(self) -> List[str]:
         """Extract certifications from resume - ONLY certificate titles, not descriptions."""
         certifications = []
-        text_lower = self.text_content.lower()
+        text_lower = self._get_text_lower()
         
         # Find certifications section
         cert_section_pattern = r'certification\w*\s*:?\s*(.*?)(?:project|experience|education|skill|$)'
@@ -1297,8 +1372,8 @@ class ResumeParser:
                 # Extract responsibilities (bullets)
                 responsibilities = []
                 for l in lines:
-                    if re.match(r'^(•|\-|\*|\(cid:127\))', l):
-                        responsibilities.append(re.sub(r'^(•|\-|\*|\(cid:127\))\s*', '', l).strip())
+                    if l.startswith(_BULLET_PREFIXES):
+                        responsibilities.append(_strip_bullet(l))
                 
                 # Find date line in this entry
                 date_line = ''
@@ -1314,7 +1389,7 @@ class ResumeParser:
                 role = ''
                 company = ''
                 for i, l in enumerate(lines):
-                    if l == date_line or re.match(r'^(•|\-|\*|\(cid:127\))', l):
+                    if l == date_line or l.startswith(_BULLET_PREFIXES):
                         continue
                     if not role:
                         role = l
@@ -1372,7 +1447,7 @@ class ResumeParser:
             
             for k in range(start_idx, date_idx):
                 line = exp_lines[k].strip()
-                if line and not re.match(r'^(•|\-|\*|\(cid:127\))', line):
+                if line and not line.startswith(_BULLET_PREFIXES):
                     pre_date_lines.append(line)
             
             # Typical pattern: Role title, then Company/Location
@@ -1416,10 +1491,10 @@ class ResumeParser:
             responsibilities = []
             for k in range(date_idx + 1, end_idx):
                 line = exp_lines[k].strip()
-                if re.match(r'^(•|\-|\*|\(cid:127\))', line):
-                    resp_text = re.sub(r'^(•|\-|\*|\(cid:127\))\s*', '', line).strip()
+                if line.startswith(_BULLET_PREFIXES):
+                    resp_text = _strip_bullet(line)
                     if resp_text and len(resp_text) > 5:
-                        responsibilities.append(resp_text)
+                        responsibilities.append(self._clean_string(resp_text))
             
             if not role:
                 continue
@@ -1448,15 +1523,12 @@ class ResumeParser:
                 start_date = ''
                 end_date = ''
             
-            # Clean responsibilities
-            cleaned_responsibilities = [self._clean_string(r) for r in responsibilities]
-            
             experiences.append({
                 'role': role[:100],
                 'company': company[:100] if company else '',
                 'duration_months': duration_months,
                 'type': exp_type,
-                'responsibilities': cleaned_responsibilities,
+                'responsibilities': responsibilities,
                 'start_date': start_date,
                 'end_date': end_date
             })
@@ -1467,25 +1539,27 @@ class ResumeParser:
     def count_projects(self) -> int:
         """
         ✅ IMPROVED: Count projects mentioned in resume.
-        Looks for explicit project entries.
+        Looks for explicit project entries in the projects section, falling
+        back to a whole-text scan when no projects heading is recognised.
         """
-        text_lower = self.text_content.lower()
-        
-        # Look for projects section
-        projects_section_pattern = r'projects?\s*:?\s*(.*?)(?:experience|skills|education|certification|$)'
-        projects_matches = re.findall(projects_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        # Reuse the heading-based section split instead of a second full-text scan
+        sections = self._get_sections()
+        if 'projects' in sections:
+            proj_lines = sections['projects']
+            bullet_count = sum(1 for line in proj_lines if _PROJECT_BULLET_RE.match(line))
+        else:
+            # Heading not recognised by the section split; scan the whole text
+            projects_matches = _PROJECTS_BLOCK_RE.findall(self._get_text_lower())
+            projects_text = projects_matches[0] if projects_matches else ''
+            proj_lines = projects_text.split('\n') if projects_text else []
+            bullet_count = len(_PROJECT_BULLET_TEXT_RE.findall(projects_text))
         
-        if not projects_matches:
+        if not proj_lines:
             # No projects section found
             log_dev("No projects section found")
             return 0
         
-        projects_text = projects_matches[0]
-        
         # Strategy 1: Count bullet points or numbered items
-        bullet_pattern = r'(?:^|\n)\s*[•\-\*\d+\.]\s+'
-        bullet_count = len(re.findall(bullet_pattern, projects_text))
-        
         if bullet_count > 0:
             log_dev(f"Found {bullet_count} projects from bullet points")
             return min(bullet_count, 20)  # Cap at 20
@@ -1493,10 +1567,9 @@ class ResumeParser:
         # Strategy 2: Count lines with project indicators
         indicators = ['github', 'gitlab', 'project', 'built', 'developed', 
                      'created', 'designed', 'implemented']
-        lines = projects_text.split('\n')
         
         project_count = 0
-        for line in lines:
+        for line in proj_lines:
             if any(indicator in line.lower() for indicator in indicators) and len(line) > 15:
                 project_count += 1
         
@@ -1535,33 +1608,18 @@ class ResumeParser:
             project_text = description.lower()
             
             # Check for known tools in THIS project's description only
-            known_tools = self.FRAMEWORKS_LIBRARIES + self.PROGRAMMING_LANGUAGES + self.TOOLS_PLATFORMS + self.DATABASES
-            for tool in known_tools:
+            for tool in self.KNOWN_TOOLS_LOWER:
                 # Must appear verbatim in project description
-                if re.search(r'\b' + re.escape(tool.lower()) + r'\b', project_text):
+                if re.search(r'\b' + re.escape(tool) + r'\b', project_text):
                     # Add canonical form if available
-                    canonical = self.SKILL_CANONICAL.get(tool.lower(), tool.title())
+                    canonical = self.SKILL_CANONICAL.get(tool, tool.title())
                     if canonical not in tools_methods:
                         tools_methods.append(canonical)
             
             # Extract method names from project description only
-            method_patterns = [
-                r'(?:TF-IDF|TF/IDF|tfidf)',
-                r'(?:Cosine Similarity|cosine similarity)',
-                r'(?:Random Forest|random forest)',
-                r'(?:Logistic Regression|logistic regression)',
-                r'(?:Neural Network|neural networks)',
-                r'(?:Feature Engineering|feature engineering)',
-                r'(?:Hyperparameter Tuning|hyperparameter tuning)',
-                r'(?:Exploratory Data Analysis|EDA)',
-                r'(?:NLP|Natural Language Processing)',
-                r'(?:CNN|Convolutional Neural Network)',
-                r'(?:RNN|Recurrent Neural Network)',
-                r'(?:LSTM|Long Short-Term Memory)',
-            ]
-            for pattern in method_patterns:
-                if re.search(pattern, description, re.IGNORECASE):
-                    match = re.search(pattern, description, re.IGNORECASE)
+            for pattern in _METHOD_PATTERNS:
+                match = pattern.search(description)
+                if match:
                     method = match.group(0)
                     if method not in tools_methods:
                         tools_methods.append(method)
@@ -1579,25 +1637,22 @@ class ResumeParser:
             if self._detect_section_key(line) == 'projects':
                 continue
             
+            # Month names / years mark a title line; plain substring tests beat a regex alternation
+            line_lower = line.lower()
+            has_date = (
+                any(month in line_lower for month in _MONTH_PREFIXES) or
+                _FOUR_DIGIT_RE.search(line) is not None
+            )
+            
             # Check if line is a bullet or description line
             is_bullet = (
-                re.match(r'^(•|\-|\*|\(cid:127\))', line) or  # Starts with bullet
-                line.lower().startswith('developed') or
-                line.lower().startswith('built') or
-                line.lower().startswith('created') or
-                line.lower().startswith('implemented') or
-                line.lower().startswith('integrated') or
-                line.lower().startswith('demonstrated') or
-                line.lower().startswith('used') or
-                line.lower().startswith('leveraged') or
-                line.lower().startswith('designed') or
-                line.lower().startswith('technologies:') or
-                line.lower().startswith('tech stack:') or
-                (current_title and not re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4})', line, re.IGNORECASE))  # Not a title with date
+                line.startswith(_BULLET_PREFIXES) or  # Starts with bullet
+                line_lower.startswith(_DESCRIPTION_STARTERS) or
+                (current_title and not has_date)  # Not a title with date
             )
             
             # Detect title line (has date or looks like a title)
-            if not is_bullet and (re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d{4})', line, re.IGNORECASE) or not current_title):
+            if not is_bullet and (has_date or not current_title):
                 # New title encountered
                 if current_title:
                     flush_project()
@@ -1605,7 +1660,7 @@ class ResumeParser:
                 continue
 
             # Bullet/description line
-            bullet_text = re.sub(r'^(•|\-|\*|\(cid:127\))\s*', '', line).strip()
+            bullet_text = _strip_bullet(line)
             if bullet_text:
                 current_desc.append(bullet_text)
 
@@ -1630,15 +1685,8 @@ class ResumeParser:
             value = float(matches[0][0])
             max_scale = float(matches[0][1]) if matches[0][1] else 10.0
             
-            # Normalize to 10-point scale
-            if max_scale == 4.0:
-                normalized = (value / 4.0) * 10.0
-            elif max_scale == 5.0:
-                normalized = (value / 5.0) * 10.0
-            elif max_scale == 10.0:
-                normalized = value
-            else:
-                normalized = value  # Assume 10-point scale
+            # Normalize to 10-point scale (unknown scales are assumed 10-point)
+            normalized = value * _CGPA_SCALE_MULTIPLIER.get(max_scale, 1.0)
             
             log_dev(f"Extracted CGPA: {normalized}/10 (from {value}/{max_scale})")
             return round(min(normalized, 10.0), 2)
@@ -1652,13 +1700,9 @@ class ResumeParser:
             max_scale = float(match[1])
             
             # Check if it's a reasonable GPA range
-            if 0 <= value <= max_scale and max_scale in [4.0, 5.0, 10.0]:
-                if max_scale == 4.0:
-                    normalized = (value / 4.0) * 10.0
-                elif max_scale == 5.0:
-                    normalized = (value / 5.0) * 10.0
-                else:
-                    normalized = value
+            multiplier = _CGPA_SCALE_MULTIPLIER.get(max_scale)
+            if multiplier is not None and 0 <= value <= max_scale:
+                normalized = value * multiplier
                 
                 log_dev(f"Extracted CGPA: {normalized}/10 (from {value}/{max_scale})")
                 return round(min(normalized, 10.0), 2)
@@ -1713,15 +1757,17 @@ class ResumeParser:
             
             # Clean text
             self.text_content = self.raw_text.strip()
+            self._text_lower = None
+            self._sections_cache = None
             
             # ✅ Extract structured components
             skills_data = self.extract_skills()
             education = self.extract_education()
             experience_months = self.extract_experience_months()
             experience_details = self.extract_experience_details()
-            projects_count = self.count_projects()
             projects_details = self.extract_projects_details()
             cgpa = self.extract_cgpa()
+            certifications = self.extract_certifications()
 
             # ✅ CRITICAL: experience_months_total MUST equal sum of experience entries only
             # DO NOT use date range calculation (that can include education dates)
@@ -1730,18 +1776,18 @@ class ResumeParser:
             else:
                 experience_months = 0
 
-            if projects_details:
-                projects_count = max(projects_count, len(projects_details))
+            # Detailed project entries are authoritative; only fall back to the
+            # bullet/indicator count when none were extracted
+            projects_count = len(projects_details) or self.count_projects()
             
             # ✅ Cross-section skill harvesting (experience, projects, tech stack, full resume)
-            harvest_texts = [self.text_content]
-            if experience_details:
-                for exp in experience_details:
-                    harvest_texts.extend(exp.get('responsibilities', []))
-            if projects_details:
-                for proj in projects_details:
-                    harvest_texts.append(proj.get('description', ''))
-            harvested = self._harvest_skills_from_texts(harvest_texts)
+            def iter_harvest_texts():
+                yield self.text_content
+                for exp in experience_details or ():
+                    yield from exp.get('responsibilities') or ()
+                for proj in projects_details or ():
+                    yield proj.get('description', '')
+            harvested = self._harvest_skills_from_texts(iter_harvest_texts())
             for key in ['technical_skills', 'programming_languages', 'frameworks_libraries', 'tools_platforms', 'databases']:
                 skills_data[key].extend(list(harvested.get(key, [])))
 
@@ -1764,9 +1810,6 @@ class ResumeParser:
                 skills_data, education, experience_months, projects_count
             )
             
-            # ✅ Extract certifications
-            certifications = self.extract_certifications()
-            
             # ✅ RETURN STRUCTURED DATA (PRODUCTION-GRADE)
             result = {
                 # ✅ Categorized technical skills
@@ -1777,7 +1820,7 @@ class ResumeParser:
                 'databases': skills_data['databases'],
                 
                 # ✅ Soft skills (inferred from responsibilities)
-                'soft_skills': sorted(list(set(combined_soft_skills))),
+                'soft_skills': sorted(set(combined_soft_skills)),
                 
                 # ✅ Experience (STRICT: total = sum of entries only)
                 'experience': experience_details,
@@ -1824,33 +1867,35 @@ def log_dev(msg: str):
         print(f"DEBUG: {msg}", file=sys.stderr)
 
 
+# ====================
+# DEFAULT RESPONSE (on any error)
+# ====================
+# Static, so serialize it once instead of on every failure path
+_DEFAULT_RESPONSE_JSON = json.dumps({
+    # ✅ STRUCTURED EMPTY RESPONSE
+    'technical_skills': [],
+    'programming_languages': [],
+    'frameworks_libraries': [],
+    'tools_platforms': [],
+    'databases': [],
+    'soft_skills': [],
+    'experience': [],
+    'experience_months_total': 0,
+    'projects': [],
+    'education': [],
+    'certifications': [],
+    'resume_completeness_score': 0,
+})
+
+
 def main():
     """Main entry point for resume parser."""
-    # ====================
-    # DEFAULT RESPONSE (on any error)
-    # ====================
-    default_response = {
-        # ✅ STRUCTURED EMPTY RESPONSE
-        'technical_skills': [],
-        'programming_languages': [],
-        'frameworks_libraries': [],
-        'tools_platforms': [],
-        'databases': [],
-        'soft_skills': [],
-        'experience': [],
-        'experience_months_total': 0,
-        'projects': [],
-        'education': [],
-        'certifications': [],
-        'resume_completeness_score': 0,
-    }
-    
     try:
         # Validate arguments
         if len(sys.argv) != 2:
             # Print to stderr for debugging, return default JSON to stdout
             print("ERROR: Usage: resume_parser.py <file_path>", file=sys.stderr)
-            print(json.dumps(default_response))
+            print(_DEFAULT_RESPONSE_JSON)
             sys.exit(0)
         
         file_path = sys.argv[1]
@@ -1858,7 +1903,7 @@ def main():
         # Validate file exists
         if not os.path.exists(file_path):
             print(f"ERROR: File not found: {file_path}", file=sys.stderr)
-            print(json.dumps(default_response))
+            print(_DEFAULT_RESPONSE_JSON)
             sys.exit(0)
         
         # Parse resume
@@ -1869,14 +1914,14 @@ def main():
             sys.exit(0)
         except Exception as parse_err:
             print(f"ERROR: Resume parsing failed: {str(parse_err)}", file=sys.stderr)
-            print(json.dumps(default_response))
+            print(_DEFAULT_RESPONSE_JSON)
             sys.exit(0)
     
     except Exception as e:
         # Catch any unexpected errors and log to stderr
         print(f"CRITICAL ERROR: {str(e)}", file=sys.stderr)
         # Always return valid JSON to stdout, never crash
-        print(json.dumps(default_response))
+        print(_DEFAULT_RESPONSE_JSON)
         sys.exit(0)
 
 
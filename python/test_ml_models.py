@@ -12,16 +12,27 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from ml_predictor import MLPredictor
 import json
 
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models")
+
+# Shared predictor so the RF pickle and job embeddings are loaded once per run
+_PREDICTOR = None
+_LOAD_RESULT = None
+
+def get_predictor():
+    """Load models on first use and reuse the same predictor across tests"""
+    global _PREDICTOR, _LOAD_RESULT
+    if _PREDICTOR is None:
+        _PREDICTOR = MLPredictor(MODELS_DIR)
+        _LOAD_RESULT = _PREDICTOR.load_models()
+    return _PREDICTOR, _LOAD_RESULT
+
 def test_model_loading():
     """Test if models can be loaded"""
     print("=" * 60)
     print("TEST 1: Model Loading")
     print("=" * 60)
     
-    models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
-    predictor = MLPredictor(models_dir)
-    
-    result = predictor.load_models()
+    predictor, result = get_predictor()
     
     print(json.dumps(result, indent=2))
     
@@ -42,11 +53,8 @@ def test_candidate_prediction():
     print("TEST 2: Candidate Strength Prediction")
     print("=" * 60)
     
-    models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
-    predictor = MLPredictor(models_dir)
-    
-    # Load models
-    load_result = predictor.load_models()
+    # Reuse models loaded by the first test
+    predictor, load_result = get_predictor()
     if not load_result['success']:
         print(f"❌ Cannot test prediction - models not loaded: {load_result['error']}")
         return False
@@ -96,11 +104,8 @@ def test_full_prediction():
     print("TEST 3: Full Shortlist Probability")
     print("=" * 60)
     
-    models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
-    predictor = MLPredictor(models_dir)
-    
-    # Load models
-    load_result = predictor.load_models()
+    # Reuse models loaded by the first test
+    predictor, load_result = get_predictor()
     if not load_result['success']:
         print(f"❌ Cannot test prediction - models not loaded: {load_result['error']}")
         return False
@@ -1,5 +1,7 @@
 import json
+import math
 import sys
+from collections import OrderedDict
 from pathlib import Path
 import joblib
 import numpy as np
@@ -17,62 +19,369 @@ Returns JSON with:
 - shortlist_probability
 - model_type
 - contributions: [{"feature": name, "impact": value}]
+
+Modes:
+    python run_inference.py [model_path]          # one-shot: read one payload, exit
+    python run_inference.py [model_path] --serve  # persistent worker: load the model once,
+                                                  # then answer newline-delimited JSON payloads
+                                                  # on stdin with one JSON line each on stdout
+
+In --serve mode a payload may instead carry "features_matrix" (a list of
+feature rows) and gets back "shortlist_probabilities", one per row.
 """
 
-MODEL_PATH = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("models/shortlist_model.pkl")
-
-if not MODEL_PATH.exists():
-    print(json.dumps({"error": f"Model file not found: {MODEL_PATH}"}), file=sys.stderr)
-    sys.exit(2)
-
-try:
-    package = joblib.load(MODEL_PATH)
-except Exception as e:
-    print(json.dumps({"error": f"Failed to load model: {e}"}), file=sys.stderr)
-    sys.exit(3)
-
-model = package.get("model", package)
-feature_names = package.get("feature_names")
-model_type = package.get("metadata", {}).get("model_type", type(model).__name__)
-
-payload = json.load(sys.stdin)
-features = payload.get("features")
-input_feature_names = payload.get("feature_names")
-
-if features is None or input_feature_names is None:
-    print(json.dumps({"error": "Missing features or feature_names in payload"}), file=sys.stderr)
-    sys.exit(4)
-
-features = np.array(features, dtype=float)
-if features.ndim != 1:
-    print(json.dumps({"error": "features must be a 1-D array"}), file=sys.stderr)
-    sys.exit(5)
-
-# Predict probability
-try:
-    prob = float(model.predict_proba(features.reshape(1, -1))[0, 1])
-except Exception as e:
-    print(json.dumps({"error": f"Inference failed: {e}"}), file=sys.stderr)
-    sys.exit(6)
-
-contributions = []
-try:
-    if hasattr(model, "coef_"):
-        coefs = model.coef_[0]
-        for name, val, coef in zip(input_feature_names, features, coefs):
-            contributions.append({"feature": name, "impact": float(val * coef)})
-    elif hasattr(model, "feature_importances_"):
-        for name, imp in zip(input_feature_names, model.feature_importances_):
-            contributions.append({"feature": name, "impact": float(imp)})
-except Exception:
-    # If contribution computation fails, fall back silently
-    contributions = []
-
-# Sort contributions by absolute impact descending
-contributions = sorted(contributions, key=lambda x: abs(x.get("impact", 0.0)), reverse=True)
-
-print(json.dumps({
-    "shortlist_probability": prob,
-    "model_type": model_type,
-    "contributions": contributions,
-}))
+DEFAULT_MODEL_PATH = Path("models/shortlist_model.pkl")
+
+# --serve result cache: entries kept, feature rounding for the key, and how
+# often (in requests) hit statistics are reported on stderr
+SCORE_CACHE_SIZE = 4096
+SCORE_CACHE_DECIMALS = 4
+SCORE_CACHE_REPORT_EVERY = 1000
+
+
+class InferenceError(Exception):
+    """Inference failure carrying the exit code used by the one-shot CLI."""
+
+    def __init__(self, message: str, exit_code: int):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+def load_package(model_path: Path):
+    """Load the model package once and return (model, model_type, feature_names, feature_importances)."""
+    if not model_path.exists():
+        raise InferenceError(f"Model file not found: {model_path}", 2)
+
+    try:
+        package = joblib.load(model_path, mmap_mode="r")
+    except Exception as e:
+        raise InferenceError(f"Failed to load model: {e}", 3)
+
+    model = package.get("model", package)
+    feature_names = package.get("feature_names")
+    model_type = package.get("metadata", {}).get("model_type", type(model).__name__)
+    return model, model_type, feature_names, package.get("feature_importances")
+
+
+def load_linear_sidecar(model_path: Path):
+    """
+    Return (weights, intercept) from the .linear.npy sidecar written by
+    train_shortlist_model.py, or None when it is missing or older than the model.
+    """
+    sidecar = model_path.with_suffix(".linear.npy")
+    try:
+        if not sidecar.exists() or sidecar.stat().st_mtime < model_path.stat().st_mtime:
+            return None
+        linear = np.load(sidecar, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if linear.ndim != 1 or linear.shape[0] < 2:
+        return None
+    return np.asarray(linear[:-1], dtype=np.float64), float(linear[-1])
+
+
+def load_quantized_sidecar(model_path: Path):
+    """
+    Return (w_q, scale, intercept) from the .q8.npz sidecar written by
+    train_shortlist_model.py --quantize, or None when it is missing or stale.
+    """
+    sidecar = model_path.with_suffix(".q8.npz")
+    try:
+        if not sidecar.exists() or sidecar.stat().st_mtime < model_path.stat().st_mtime:
+            return None
+        with np.load(sidecar) as data:
+            w_q, scale, intercept = data["w_q"], float(data["scale"]), float(data["intercept"])
+    except (OSError, ValueError, KeyError):
+        return None
+    if w_q.ndim != 1 or w_q.dtype != np.int8:
+        return None
+    return w_q, scale, intercept
+
+
+def load_scorer(model_path: Path) -> "ShortlistScorer":
+    """Build a scorer, preferring the pickle-free sidecars when available."""
+    if not model_path.exists():
+        raise InferenceError(f"Model file not found: {model_path}", 2)
+
+    quantized = load_quantized_sidecar(model_path)
+    if quantized is not None:
+        return ShortlistScorer.from_quantized(*quantized)
+
+    linear = load_linear_sidecar(model_path)
+    if linear is not None:
+        return ShortlistScorer.from_linear(*linear)
+    return ShortlistScorer(*load_package(model_path))
+
+
+class ShortlistScorer:
+    """Loaded model plus anything that can be precomputed once per process."""
+
+    def __init__(self, model, model_type: str, feature_names=None, feature_importances=None):
+        self.model = model
+        self.model_type = model_type
+        # Held-out importances saved with models that have no importances of their own
+        self.importances = (
+            np.asarray(feature_importances, dtype=np.float64) if feature_importances is not None else None
+        )
+
+        # Reusable input buffer so a request doesn't allocate its feature vector
+        n_features = getattr(model, "n_features_in_", None) or len(feature_names or [])
+        self._buf = np.empty(n_features, dtype=np.float64) if n_features else None
+
+        # Binary logistic regression: score with w.x + b directly instead of
+        # going through predict_proba's validation and allocation per request
+        self.weights = None
+        self.intercept = 0.0
+        self._w_q = None
+        self._q_scale = 0.0
+        # Binary gradient boosting with log-loss: decision_function is the
+        # log-odds, so sigmoid(decision_function) == predict_proba[:, 1]
+        # without the probability-normalization wrapper
+        self._log_odds = False
+        if model is not None:
+            from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+            from sklearn.linear_model import LogisticRegression
+
+            if isinstance(model, LogisticRegression) and model.coef_.shape[0] == 1:
+                self.weights = model.coef_[0].astype(np.float64)
+                self.intercept = float(model.intercept_[0])
+            elif isinstance(model, (GradientBoostingClassifier, HistGradientBoostingClassifier)):
+                self._log_odds = (
+                    len(getattr(model, "classes_", ())) == 2
+                    and getattr(model, "loss", None) in ("log_loss", "deviance")
+                )
+
+    @classmethod
+    def from_linear(cls, weights: np.ndarray, intercept: float) -> "ShortlistScorer":
+        """Scorer for a logistic model restored from its weights sidecar (no pickle)."""
+        scorer = cls(None, "logistic")
+        scorer.weights = weights
+        scorer.intercept = intercept
+        scorer._buf = np.empty(weights.shape[0], dtype=np.float64)
+        return scorer
+
+    @classmethod
+    def from_quantized(cls, w_q: np.ndarray, scale: float, intercept: float) -> "ShortlistScorer":
+        """Scorer for int8 weights; features in [0, 1] are quantized to int8 as well."""
+        scorer = cls.from_linear(w_q.astype(np.float64) * scale, intercept)
+        scorer.model_type = "logistic_int8"
+        # int32 so the dot product can't overflow int8
+        scorer._w_q = w_q.astype(np.int32)
+        scorer._q_scale = scale / 127
+        return scorer
+
+    def _load_features(self, features) -> np.ndarray:
+        """Validate the payload features and copy them into the float64 buffer."""
+        buf = self._buf
+        if buf is None:
+            features = np.asarray(features, dtype=np.float64)
+            if features.ndim != 1:
+                raise InferenceError("features must be a 1-D array", 5)
+            return features
+
+        if not isinstance(features, list) or len(features) != buf.size:
+            raise InferenceError(f"features must be a 1-D array of {buf.size} values", 5)
+        try:
+            buf[:] = features
+        except (TypeError, ValueError) as e:
+            raise InferenceError(f"features must be numeric: {e}", 5)
+        return buf
+
+    def predict(self, payload: dict) -> dict:
+        """Run inference for a single payload against the loaded model."""
+        if not isinstance(payload, dict):
+            raise InferenceError("Payload must be a JSON object", 4)
+
+        features = payload.get("features")
+        input_feature_names = payload.get("feature_names")
+
+        if features is None or input_feature_names is None:
+            raise InferenceError("Missing features or feature_names in payload", 4)
+
+        features = self._load_features(features)
+
+        model = self.model
+        impacts = None
+        if self._w_q is not None and 0.0 <= features.min() and features.max() <= 1.0:
+            # Integer-only product; one scale multiply brings it back to logit units
+            x_q = np.rint(features * 127).astype(np.int32)
+            impacts = (self._w_q * x_q) * self._q_scale
+            z = float(impacts.sum()) + self.intercept
+            prob = 1.0 / (1.0 + math.exp(-z)) if z >= 0 else math.exp(z) / (1.0 + math.exp(z))
+        elif self.weights is not None:
+            # One elementwise product serves both the logit and the contributions
+            impacts = self.weights * features
+            z = float(impacts.sum()) + self.intercept
+            prob = 1.0 / (1.0 + math.exp(-z)) if z >= 0 else math.exp(z) / (1.0 + math.exp(z))
+        else:
+            # Predict probability
+            prob = None
+            if self._log_odds:
+                try:
+                    z = float(model.decision_function(features.reshape(1, -1))[0])
+                    prob = 1.0 / (1.0 + math.exp(-z)) if z >= 0 else math.exp(z) / (1.0 + math.exp(z))
+                except Exception:
+                    # Raw API changed or failed: fall back to predict_proba
+                    prob = None
+            if prob is None:
+                try:
+                    prob = float(model.predict_proba(features.reshape(1, -1))[0, 1])
+                except Exception as e:
+                    raise InferenceError(f"Inference failed: {e}", 6)
+
+            try:
+                if hasattr(model, "coef_"):
+                    impacts = np.multiply(features, model.coef_[0])
+                elif hasattr(model, "feature_importances_"):
+                    impacts = np.asarray(model.feature_importances_, dtype=np.float64)
+                elif self.importances is not None:
+                    impacts = self.importances
+            except Exception:
+                # If contribution computation fails, fall back silently
+                impacts = None
+
+        contributions = []
+        if impacts is not None:
+            impacts = impacts[:len(input_feature_names)]
+            # Order by absolute impact descending (stable, so ties keep feature order)
+            order = np.argsort(-np.abs(impacts), kind="stable")
+            contributions = [
+                {"feature": input_feature_names[i], "impact": float(impacts[i])}
+                for i in order
+            ]
+
+        return {
+            "shortlist_probability": prob,
+            "model_type": self.model_type,
+            "contributions": contributions,
+        }
+
+
+    def predict_batch(self, payload: dict) -> dict:
+        """Score every row of payload["features_matrix"] in one call."""
+        matrix = payload.get("features_matrix")
+        if not isinstance(matrix, list):
+            raise InferenceError("features_matrix must be a list of feature rows", 4)
+
+        try:
+            X = np.asarray(matrix, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise InferenceError(f"features_matrix must be numeric: {e}", 5)
+
+        n_features = self._buf.size if self._buf is not None else None
+        if X.ndim != 2 or (n_features and X.shape[1] != n_features):
+            raise InferenceError(f"features_matrix must have shape (n, {n_features})", 5)
+
+        if self.weights is not None:
+            # Compiled kernel when numba is available; imported lazily so
+            # one-shot calls don't pay for it
+            from batch_score import batch_score
+
+            probs = batch_score(X, self.weights, self.intercept)
+        else:
+            try:
+                probs = self.model.predict_proba(X)[:, 1]
+            except Exception as e:
+                raise InferenceError(f"Inference failed: {e}", 6)
+
+        return {
+            "shortlist_probabilities": probs.tolist(),
+            "model_type": self.model_type,
+        }
+
+
+def run_once(model_path: Path) -> int:
+    """Original CLI behaviour: one payload on stdin, one JSON result on stdout."""
+    try:
+        scorer = load_scorer(model_path)
+        result = scorer.predict(json.load(sys.stdin))
+    except InferenceError as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return e.exit_code
+
+    print(json.dumps(result))
+    return 0
+
+
+def _cache_key(payload):
+    """(rounded features, feature names) for a well-formed single payload, else None."""
+    if not isinstance(payload, dict):
+        return None
+    features = payload.get("features")
+    names = payload.get("feature_names")
+    if not isinstance(features, list) or not isinstance(names, list):
+        return None
+    if not all(isinstance(n, str) for n in names):
+        return None
+    try:
+        return tuple(round(float(f), SCORE_CACHE_DECIMALS) for f in features), tuple(names)
+    except (TypeError, ValueError):
+        return None
+
+
+def serve(model_path: Path) -> int:
+    """Persistent worker: load once, then answer one JSON line per input line."""
+    try:
+        scorer = load_scorer(model_path)
+    except InferenceError as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return e.exit_code
+
+    # The UI re-scores the same (user, role) vector on re-render; cache the
+    # serialized result. Entries are keyed by the rounded features, but a miss
+    # scores the payload as sent, so a first request answers exactly as the
+    # one-shot mode does. The cache lives with this scorer, so a new model
+    # (new process) always starts empty.
+    cache: "OrderedDict[tuple, str]" = OrderedDict()
+    hits = 0
+
+    def score(key: tuple, payload: dict) -> str:
+        nonlocal hits
+        output = cache.get(key)
+        if output is not None:
+            cache.move_to_end(key)
+            hits += 1
+            return output
+        output = json.dumps(scorer.predict(payload))
+        cache[key] = output
+        if len(cache) > SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return output
+
+    requests = 0
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+            if isinstance(payload, dict) and "features_matrix" in payload:
+                output = json.dumps(scorer.predict_batch(payload))
+            else:
+                key = _cache_key(payload)
+                output = score(key, payload) if key is not None else json.dumps(scorer.predict(payload))
+        except InferenceError as e:
+            output = json.dumps({"error": str(e)})
+        except ValueError as e:
+            output = json.dumps({"error": f"Invalid JSON payload: {e}"})
+        sys.stdout.write(output + "\n")
+        sys.stdout.flush()
+
+        requests += 1
+        if requests % SCORE_CACHE_REPORT_EVERY == 0:
+            print(f"score cache: {hits} hits / {requests} requests, {len(cache)} entries", file=sys.stderr)
+
+    return 0
+
+
+def main() -> int:
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    model_path = Path(args[0]) if args else DEFAULT_MODEL_PATH
+
+    if "--serve" in sys.argv[1:]:
+        return serve(model_path)
+    return run_once(model_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
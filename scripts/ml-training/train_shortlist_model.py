@@ -6,6 +6,9 @@ should be shortlisted based on engineered feature vectors from Prompt 5.
 
 Usage:
     python train_shortlist_model.py --data training_data.csv --model logistic
+    python train_shortlist_model.py --data training_data.csv --model logistic --cache
+    python train_shortlist_model.py --data big_training_data.csv --chunksize 100000
+    python train_shortlist_model.py --convert shortlist_model.pkl
 
 Features (all normalized 0-1):
     - skill_match_score
@@ -21,24 +24,29 @@ Target:
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import GradientBoostingClassifier
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+from sklearn.inspection import permutation_importance
 from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
     roc_auc_score,
     confusion_matrix,
     classification_report
 )
 import joblib
+from joblib import Memory
 import argparse
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import pyarrow  # noqa: F401  (enables the multi-threaded CSV reader)
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # Feature names (must match Prompt 5 output)
 FEATURE_COLUMNS = [
     "skill_match_score",
@@ -51,13 +59,20 @@ FEATURE_COLUMNS = [
 
 TARGET_COLUMN = "shortlist_label"
 
+# Location of the --cache memoization store
+CACHE_DIR = ".cache/train"
+
+# Above this many training rows, switch to the multi-core solvers/estimators
+LARGE_DATASET_ROWS = 10_000
 
-def load_and_validate_data(csv_path: str) -> pd.DataFrame:
+
+def load_and_validate_data(csv_path: str, verbose: bool = False) -> pd.DataFrame:
     """
     Load training data from CSV and validate schema.
     
     Args:
         csv_path: Path to CSV file with training data
+        verbose: Print per-column missing-value counts
         
     Returns:
         Validated DataFrame
@@ -70,21 +85,23 @@ def load_and_validate_data(csv_path: str) -> pd.DataFrame:
     if not Path(csv_path).exists():
         raise FileNotFoundError(f"Training data file not found: {csv_path}")
     
-    df = pd.read_csv(csv_path)
-    print(f"Loaded {len(df)} samples")
-    
-    # Validate required columns
+    # Validate required columns (header only, before the typed read)
     required_cols = FEATURE_COLUMNS + [TARGET_COLUMN]
-    missing_cols = set(required_cols) - set(df.columns)
+    header = pd.read_csv(csv_path, nrows=0).columns
+    missing_cols = set(required_cols) - set(header)
     
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
     
-    # Validate feature ranges (should be 0-1)
-    for col in FEATURE_COLUMNS:
-        if df[col].min() < 0 or df[col].max() > 1:
-            print(f"WARNING: Feature '{col}' has values outside [0, 1] range")
-            print(f"  Min: {df[col].min()}, Max: {df[col].max()}")
+    # Read only the needed columns with fixed dtypes: no inference pass, and
+    # float32 features take half the memory of the default float64
+    df = pd.read_csv(
+        csv_path,
+        usecols=required_cols,
+        dtype={col: np.float32 for col in FEATURE_COLUMNS},
+        engine=CSV_ENGINE,
+    )
+    print(f"Loaded {len(df)} samples")
     
     # Validate target (should be 0 or 1)
     unique_labels = df[TARGET_COLUMN].unique()
@@ -100,18 +117,135 @@ def load_and_validate_data(csv_path: str) -> pd.DataFrame:
     if label_counts.get(0, 0) == 0 or label_counts.get(1, 0) == 0:
         raise ValueError("Training data must contain both positive and negative examples")
     
-    # Check for missing values
-    missing = df[required_cols].isnull().sum()
-    if missing.any():
-        print("\nWARNING: Missing values detected:")
-        print(missing[missing > 0])
-        print("Rows with missing values will be dropped.")
-        df = df.dropna(subset=required_cols)
+    # Check for missing values (one boolean mask instead of counting then dropna)
+    mask = df[required_cols].notna().all(axis=1).to_numpy()
+    dropped = int((~mask).sum())
+    if dropped:
+        print(f"\nWARNING: Dropping {dropped} rows with missing values")
+        if verbose:
+            missing = df[required_cols].isnull().sum()
+            print(missing[missing > 0])
+        df = df.loc[mask].reset_index(drop=True)
         print(f"Remaining samples after dropping: {len(df)}")
     
+    # Validate feature ranges (should be 0-1): one min/max pass over the whole block
+    block = df[FEATURE_COLUMNS].to_numpy()
+    if len(block):
+        mins = block.min(axis=0)
+        maxs = block.max(axis=0)
+        for i in np.flatnonzero((mins < 0) | (maxs > 1)):
+            print(f"WARNING: Feature '{FEATURE_COLUMNS[i]}' has values outside [0, 1] range")
+            print(f"  Min: {mins[i]}, Max: {maxs[i]}")
+    
+    # Labels are validated as 0/1 above, so the narrowest int type is enough
+    df[TARGET_COLUMN] = df[TARGET_COLUMN].astype(np.int8)
+    
     return df
 
 
+def _load_and_validate_data_at(csv_path: str, mtime: float, verbose: bool = False) -> pd.DataFrame:
+    """load_and_validate_data keyed on the file's mtime, so edits invalidate the cache."""
+    return load_and_validate_data(csv_path, verbose=verbose)
+
+
+def load_and_validate_data_chunked(csv_path: str, chunksize: int, verbose: bool = False):
+    """
+    Stream training data from CSV in chunks into a disk-backed feature matrix.
+    
+    Applies the same checks as load_and_validate_data, accumulated in a single
+    pass, so parsing memory is bounded by the chunk size instead of the file.
+    
+    Args:
+        csv_path: Path to CSV file with training data
+        chunksize: Rows parsed per chunk
+        verbose: Print per-column missing-value counts
+        
+    Returns:
+        (X, y): float32 feature matrix (memory-mapped temp file) and int8 labels
+        
+    Raises:
+        ValueError: If required columns are missing or data is invalid
+    """
+    print(f"Streaming data from {csv_path} in chunks of {chunksize}...")
+    
+    if not Path(csv_path).exists():
+        raise FileNotFoundError(f"Training data file not found: {csv_path}")
+    
+    required_cols = FEATURE_COLUMNS + [TARGET_COLUMN]
+    header = pd.read_csv(csv_path, nrows=0).columns
+    missing_cols = set(required_cols) - set(header)
+    
+    if missing_cols:
+        raise ValueError(f"Missing required columns: {missing_cols}")
+    
+    # Upper bound on the row count so the output can be preallocated
+    with open(csv_path, 'rb') as f:
+        max_rows = max(sum(1 for _ in f) - 1, 1)
+    
+    X = np.memmap(tempfile.TemporaryFile(), dtype=np.float32, mode='w+',
+                  shape=(max_rows, len(FEATURE_COLUMNS)))
+    y = np.empty(max_rows, dtype=np.int8)
+    mins = np.full(len(FEATURE_COLUMNS), np.inf)
+    maxs = np.full(len(FEATURE_COLUMNS), -np.inf)
+    missing = pd.Series(0, index=required_cols)
+    n_rows = 0
+    dropped = 0
+    
+    # The pyarrow engine does not support chunksize
+    for chunk in pd.read_csv(
+        csv_path,
+        usecols=required_cols,
+        dtype={col: np.float32 for col in FEATURE_COLUMNS},
+        chunksize=chunksize,
+    ):
+        mask = chunk[required_cols].notna().all(axis=1).to_numpy()
+        if not mask.all():
+            dropped += int((~mask).sum())
+            if verbose:
+                missing += chunk[required_cols].isnull().sum()
+            chunk = chunk.loc[mask]
+        
+        labels = chunk[TARGET_COLUMN].to_numpy()
+        invalid = labels[(labels != 0) & (labels != 1)]
+        if invalid.size:
+            raise ValueError(f"Target column must contain only 0 or 1. Found: {np.unique(invalid)}")
+        
+        block = chunk[FEATURE_COLUMNS].to_numpy()
+        rows = len(block)
+        if rows:
+            np.minimum(mins, block.min(axis=0), out=mins)
+            np.maximum(maxs, block.max(axis=0), out=maxs)
+            X[n_rows:n_rows + rows] = block
+            y[n_rows:n_rows + rows] = labels
+            n_rows += rows
+    
+    X = X[:n_rows]
+    y = y[:n_rows]
+    print(f"Loaded {n_rows + dropped} samples")
+    
+    # Check class balance
+    n_pos = int(y.sum())
+    n_neg = n_rows - n_pos
+    print(f"\nClass distribution:")
+    print(f"  Not shortlisted (0): {n_neg} ({n_neg/max(n_rows, 1)*100:.1f}%)")
+    print(f"  Shortlisted (1): {n_pos} ({n_pos/max(n_rows, 1)*100:.1f}%)")
+    
+    if n_neg == 0 or n_pos == 0:
+        raise ValueError("Training data must contain both positive and negative examples")
+    
+    if dropped:
+        print(f"\nWARNING: Dropping {dropped} rows with missing values")
+        if verbose:
+            print(missing[missing > 0])
+        print(f"Remaining samples after dropping: {n_rows}")
+    
+    for i in np.flatnonzero((mins < 0) | (maxs > 1)):
+        print(f"WARNING: Feature '{FEATURE_COLUMNS[i]}' has values outside [0, 1] range")
+        print(f"  Min: {mins[i]}, Max: {maxs[i]}")
+    
+    return X, y
+
+
 def train_model(X_train, y_train, model_type: str = "logistic", random_state: int = 42):
     """
     Train the classification model.
@@ -127,14 +261,26 @@ def train_model(X_train, y_train, model_type: str = "logistic", random_state: in
     """
     print(f"\nTraining {model_type} model...")
     
+    large = len(X_train) > LARGE_DATASET_ROWS
+    
     if model_type == "logistic":
         # Logistic Regression: Simple, fast, explainable coefficients
         model = LogisticRegression(
             random_state=random_state,
             max_iter=1000,
-            solver='lbfgs',
+            solver='saga' if large else 'lbfgs',
             class_weight='balanced'  # Handle class imbalance
         )
+    elif model_type == "gradient_boosting" and large:
+        # Histogram-based boosting: OpenMP-parallel, much faster on big data
+        model = HistGradientBoostingClassifier(
+            max_iter=100,
+            learning_rate=0.1,
+            max_depth=3,
+            early_stopping=True,
+            validation_fraction=0.1,
+            random_state=random_state
+        )
     elif model_type == "gradient_boosting":
         # Gradient Boosting: Better for non-linear patterns
         model = GradientBoostingClassifier(
@@ -147,12 +293,42 @@ def train_model(X_train, y_train, model_type: str = "logistic", random_state: in
         raise ValueError(f"Unknown model type: {model_type}")
     
     model.fit(X_train, y_train)
+    
     print("Training completed.")
     
     return model
 
 
-def evaluate_model(model, X_test, y_test, feature_names):
+def heldout_importances(model, X_test, y_test, random_state: int = 42):
+    """
+    Permutation importances on held-out rows for models without their own.
+    
+    HistGradientBoosting has no impurity importances, so evaluation and
+    run_inference.py would get no per-feature impacts. Returns None for
+    models that expose coef_ or feature_importances_.
+    
+    Args:
+        model: Trained model
+        X_test: Held-out features
+        y_test: Held-out labels
+        random_state: Random seed for the permutations
+        
+    Returns:
+        Array of mean importances per feature, or None
+    """
+    if not isinstance(model, HistGradientBoostingClassifier):
+        return None
+    result = permutation_importance(
+        model, X_test, y_test,
+        n_repeats=5,
+        max_samples=min(len(X_test), LARGE_DATASET_ROWS),
+        random_state=random_state,
+        n_jobs=-1
+    )
+    return result.importances_mean
+
+
+def evaluate_model(model, X_test, y_test, feature_names, verbose: bool = False, importances=None):
     """
     Evaluate model performance and show feature importance.
     
@@ -161,6 +337,8 @@ def evaluate_model(model, X_test, y_test, feature_names):
         X_test: Test features
         y_test: Test labels
         feature_names: List of feature names
+        verbose: Also print the confusion matrix and classification report
+        importances: Held-out importances for models without their own
         
     Returns:
         Dict of evaluation metrics
@@ -173,13 +351,16 @@ def evaluate_model(model, X_test, y_test, feature_names):
     y_pred = model.predict(X_test)
     y_pred_proba = model.predict_proba(X_test)[:, 1]  # Probability of class 1
     
-    # Metrics
+    # Metrics: derive everything from one confusion matrix instead of
+    # letting each sklearn scorer rebuild it
+    cm = confusion_matrix(y_test, y_pred, labels=[0, 1])
+    tn, fp, fn, tp = (int(v) for v in cm.ravel())
     metrics = {
-        "accuracy": accuracy_score(y_test, y_pred),
-        "precision": precision_score(y_test, y_pred, zero_division=0),
-        "recall": recall_score(y_test, y_pred, zero_division=0),
-        "f1": f1_score(y_test, y_pred, zero_division=0),
-        "roc_auc": roc_auc_score(y_test, y_pred_proba),
+        "accuracy": (tp + tn) / max(tp + tn + fp + fn, 1),
+        "precision": tp / (tp + fp) if tp + fp else 0.0,
+        "recall": tp / (tp + fn) if tp + fn else 0.0,
+        "f1": 2 * tp / (2 * tp + fp + fn) if tp else 0.0,
+        "roc_auc": float(roc_auc_score(y_test, y_pred_proba)),
     }
     
     print(f"\nAccuracy:  {metrics['accuracy']:.4f}")
@@ -188,11 +369,12 @@ def evaluate_model(model, X_test, y_test, feature_names):
     print(f"F1 Score:  {metrics['f1']:.4f}")
     print(f"ROC-AUC:   {metrics['roc_auc']:.4f}")
     
-    print("\nConfusion Matrix:")
-    print(confusion_matrix(y_test, y_pred))
-    
-    print("\nClassification Report:")
-    print(classification_report(y_test, y_pred, target_names=["Not Shortlisted", "Shortlisted"]))
+    if verbose:
+        print("\nConfusion Matrix:")
+        print(cm)
+        
+        print("\nClassification Report:")
+        print(classification_report(y_test, y_pred, target_names=["Not Shortlisted", "Shortlisted"]))
     
     # Feature importance/coefficients
     print("\n" + "="*60)
@@ -202,31 +384,29 @@ def evaluate_model(model, X_test, y_test, feature_names):
     if hasattr(model, 'coef_'):
         # Logistic Regression coefficients
         coefficients = model.coef_[0]
-        feature_importance = pd.DataFrame({
-            'feature': feature_names,
-            'coefficient': coefficients,
-            'abs_coefficient': np.abs(coefficients)
-        }).sort_values('abs_coefficient', ascending=False)
+        order = np.argsort(-np.abs(coefficients), kind="stable")
         
         print("\nLogistic Regression Coefficients:")
         print("(Positive = increases shortlist probability)")
-        print(feature_importance[['feature', 'coefficient']].to_string(index=False))
+        print(f"{'feature':<30} coefficient")
+        for i in order:
+            print(f"{feature_names[i]:<30} {coefficients[i]:+.6f}")
         
-    elif hasattr(model, 'feature_importances_'):
+    elif hasattr(model, 'feature_importances_') or importances is not None:
         # Gradient Boosting feature importances
-        importances = model.feature_importances_
-        feature_importance = pd.DataFrame({
-            'feature': feature_names,
-            'importance': importances
-        }).sort_values('importance', ascending=False)
+        if importances is None:
+            importances = model.feature_importances_
+        order = np.argsort(-importances, kind="stable")
         
         print("\nGradient Boosting Feature Importances:")
-        print(feature_importance.to_string(index=False))
+        print(f"{'feature':<30} importance")
+        for i in order:
+            print(f"{feature_names[i]:<30} {importances[i]:.6f}")
     
     return metrics
 
 
-def save_model(model, output_path: str, metadata: dict):
+def save_model(model, output_path: str, metadata: dict, quantize: bool = False, importances=None):
     """
     Save trained model and metadata to disk.
     
@@ -234,6 +414,8 @@ def save_model(model, output_path: str, metadata: dict):
         model: Trained model
         output_path: Path to save model
         metadata: Dict with training metadata
+        quantize: Also write the int8 quantized weights sidecar
+        importances: Held-out importances stored alongside the model
     """
     print(f"\nSaving model to {output_path}...")
     
@@ -242,9 +424,99 @@ def save_model(model, output_path: str, metadata: dict):
         'feature_names': FEATURE_COLUMNS,
         'metadata': metadata
     }
+    if importances is not None:
+        model_package['feature_importances'] = [float(v) for v in importances]
     
-    joblib.dump(model_package, output_path)
+    # Uncompressed so inference can joblib.load(..., mmap_mode='r')
+    joblib.dump(model_package, output_path, compress=0)
     print("Model saved successfully.")
+    
+    export_linear_sidecar(model, output_path)
+    export_quantized_sidecar(model, output_path, quantize)
+
+
+def linear_sidecar_path(model_path) -> Path:
+    """Path of the raw-weights sidecar stored next to a model package."""
+    return Path(model_path).with_suffix(".linear.npy")
+
+
+def export_linear_sidecar(model, model_path: str):
+    """
+    Write coef_ and intercept_ of a binary logistic model as a flat .npy array.
+    
+    run_inference.py memory-maps this file and scores with it directly,
+    skipping the pickle load entirely. Other model types get no sidecar.
+    
+    Args:
+        model: Trained model
+        model_path: Path of the saved model package
+    """
+    sidecar = linear_sidecar_path(model_path)
+    if not isinstance(model, LogisticRegression) or model.coef_.shape[0] != 1:
+        # Never leave a stale sidecar next to a non-linear model
+        if sidecar.exists():
+            sidecar.unlink()
+        return
+    
+    weights = np.concatenate([model.coef_[0], model.intercept_[:1]]).astype(np.float64)
+    np.save(sidecar, weights)
+    print(f"Linear weights sidecar saved to {sidecar}")
+
+
+def quantized_sidecar_path(model_path) -> Path:
+    """Path of the int8 quantized weights sidecar stored next to a model package."""
+    return Path(model_path).with_suffix(".q8.npz")
+
+
+def export_quantized_sidecar(model, model_path: str, quantize: bool = True):
+    """
+    Write int8 weights of a binary logistic model with a single scale factor.
+    
+    w_q = round(w / s_w) with s_w = max|w| / 127. run_inference.py pairs it with
+    features quantized as round(x * 127) and scores z = s_w / 127 * (w_q . x_q) + b.
+    A bfloat16 copy of w (upper 16 bits of float32) would halve model memory
+    with less error, but 6 float64 weights already fit in one cache line.
+    
+    Args:
+        model: Trained model
+        model_path: Path of the saved model package
+        quantize: When False, only remove a stale sidecar
+    """
+    sidecar = quantized_sidecar_path(model_path)
+    if not quantize or not isinstance(model, LogisticRegression) or model.coef_.shape[0] != 1:
+        if sidecar.exists():
+            sidecar.unlink()
+        return
+    
+    w = model.coef_[0].astype(np.float64)
+    max_abs = float(np.abs(w).max())
+    scale = max_abs / 127 if max_abs > 0 else 1.0
+    w_q = np.round(w / scale).astype(np.int8)
+    
+    np.savez(sidecar, w_q=w_q, scale=scale, intercept=float(model.intercept_[0]))
+    print(f"Quantized int8 weights sidecar saved to {sidecar}")
+    print(f"  Max weight error: {np.abs(w_q * scale - w).max():.6f}")
+
+
+def convert_model(model_path: str, quantize: bool = False):
+    """
+    Re-save an existing model package uncompressed and export its linear sidecar.
+    
+    Args:
+        model_path: Path of an existing model package
+        quantize: Also write the int8 quantized weights sidecar
+    """
+    print(f"Converting {model_path}...")
+    if not Path(model_path).exists():
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+    
+    model_package = joblib.load(model_path)
+    model = model_package.get('model', model_package) if isinstance(model_package, dict) else model_package
+    
+    joblib.dump(model_package, model_path, compress=0)
+    export_linear_sidecar(model, model_path)
+    export_quantized_sidecar(model, model_path, quantize)
+    print("Conversion completed.")
 
 
 def main():
@@ -252,7 +524,6 @@ def main():
     parser.add_argument(
         "--data",
         type=str,
-        required=True,
         help="Path to training data CSV file"
     )
     parser.add_argument(
@@ -281,8 +552,51 @@ def main():
         help="Random seed for reproducibility (default: 42)"
     )
     
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print detailed data validation and evaluation output"
+    )
+    
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the CSV in chunks of this many rows into a disk-backed array (for very large files)"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse loaded data and fitted models for identical inputs (stored in {CACHE_DIR})"
+    )
+    
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Also save int8 quantized logistic weights for low-footprint inference"
+    )
+    
+    parser.add_argument(
+        "--convert",
+        type=str,
+        metavar="MODEL_PATH",
+        help="Re-save an existing model uncompressed with a fast-load weights sidecar, then exit"
+    )
+    
     args = parser.parse_args()
     
+    if args.convert:
+        try:
+            convert_model(args.convert, quantize=args.quantize)
+            return 0
+        except Exception as e:
+            print(f"\nERROR: {str(e)}", file=sys.stderr)
+            return 1
+    
+    if not args.data:
+        parser.error("--data is required unless --convert is given")
+    
     print("="*60)
     print("ROLE SHORTLISTING MODEL TRAINING")
     print("="*60)
@@ -293,33 +607,51 @@ def main():
     print(f"Random seed: {args.random_seed}")
     print("="*60)
     
+    train = train_model
+    cached_load = None
+    if args.cache:
+        # Hash of (inputs, seed, model type) -> previously fitted model
+        memory = Memory(CACHE_DIR, verbose=0)
+        cached_load = memory.cache(_load_and_validate_data_at)
+        train = memory.cache(train_model)
+    
     try:
         # 1. Load and validate data
-        df = load_and_validate_data(args.data)
-        
         # 2. Split features and target
-        X = df[FEATURE_COLUMNS].values
-        y = df[TARGET_COLUMN].values
+        if args.chunksize:
+            X, y = load_and_validate_data_chunked(args.data, args.chunksize, verbose=args.verbose)
+        else:
+            if cached_load is not None and Path(args.data).exists():
+                df = cached_load(args.data, Path(args.data).stat().st_mtime, args.verbose)
+            else:
+                df = load_and_validate_data(args.data, verbose=args.verbose)
+            X = df[FEATURE_COLUMNS].values
+            y = df[TARGET_COLUMN].values
         
         print(f"\nFeature matrix shape: {X.shape}")
         print(f"Target vector shape: {y.shape}")
         
         # 3. Train-test split
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y,
+        # Stratified (maintains class distribution); index arrays, one shuffle
+        splitter = StratifiedShuffleSplit(
+            n_splits=1,
             test_size=args.test_size,
-            random_state=args.random_seed,
-            stratify=y  # Maintain class distribution
+            random_state=args.random_seed
         )
+        (train_idx, test_idx), = splitter.split(X, y)
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         
         print(f"\nTrain set: {len(X_train)} samples")
         print(f"Test set:  {len(X_test)} samples")
         
         # 4. Train model
-        model = train_model(X_train, y_train, args.model, args.random_seed)
+        model = train(X_train, y_train, args.model, args.random_seed)
         
         # 5. Evaluate model
-        metrics = evaluate_model(model, X_test, y_test, FEATURE_COLUMNS)
+        importances = heldout_importances(model, X_test, y_test, args.random_seed)
+        metrics = evaluate_model(model, X_test, y_test, FEATURE_COLUMNS, verbose=args.verbose,
+                                 importances=importances)
         
         # 6. Save model
         metadata = {
@@ -332,7 +664,7 @@ def main():
             'feature_names': FEATURE_COLUMNS,
         }
         
-        save_model(model, args.output, metadata)
+        save_model(model, args.output, metadata, quantize=args.quantize, importances=importances)
         
         print("\n" + "="*60)
         print("TRAINING COMPLETED SUCCESSFULLY")
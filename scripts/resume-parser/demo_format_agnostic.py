@@ -3,17 +3,8 @@ Demonstration of format-agnostic resume parsing.
 Shows how the parser handles different resume layouts and formats.
 """
 
-from resume_parser import parse_resume
-from pathlib import Path
+from resume_parser import parse_resume_text
 import json
-import tempfile
-
-
-def create_test_resume(content: str, filename: str) -> str:
-    """Create a temporary resume file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write(content)
-        return f.name
 
 
 def test_ats_style_resume():
@@ -53,18 +44,14 @@ PROJECTS
 - ML Pipeline: Developed data processing pipeline using Python and AWS
     """
     
-    temp_file = create_test_resume(resume, "ats_resume.txt")
-    try:
-        result = parse_resume(temp_file)
-        print(f"✓ Skills Found: {len(result['skills'])} skills")
-        print(f"  Top Skills: {', '.join(result['skills'][:8])}")
-        print(f"✓ Education: {len(result['education'])} degree(s)")
-        print(f"✓ Experience: {result['experience_months']} months")
-        print(f"✓ Projects: {result['projects_count']} projects")
-        print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
-        return result
-    finally:
-        Path(temp_file).unlink()
+    result = parse_resume_text(resume)
+    print(f"✓ Skills Found: {len(result['skills'])} skills")
+    print(f"  Top Skills: {', '.join(result['skills'][:8])}")
+    print(f"✓ Education: {len(result['education'])} degree(s)")
+    print(f"✓ Experience: {result['experience_months']} months")
+    print(f"✓ Projects: {result['projects_count']} projects")
+    print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
+    return result
 
 
 def test_minimal_resume():
@@ -94,16 +81,12 @@ Created neural network for image classification
 Built chatbot using NLP
     """
     
-    temp_file = create_test_resume(resume, "minimal_resume.txt")
-    try:
-        result = parse_resume(temp_file)
-        print(f"✓ Skills Found: {len(result['skills'])} skills")
-        print(f"  Top Skills: {', '.join(result['skills'][:6])}")
-        print(f"✓ Education: {len(result['education'])} degree(s)")
-        print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
-        return result
-    finally:
-        Path(temp_file).unlink()
+    result = parse_resume_text(resume)
+    print(f"✓ Skills Found: {len(result['skills'])} skills")
+    print(f"  Top Skills: {', '.join(result['skills'][:6])}")
+    print(f"✓ Education: {len(result['education'])} degree(s)")
+    print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
+    return result
 
 
 def test_design_heavy_resume():
@@ -150,18 +133,14 @@ KEY PROJECTS
 ▸ Infrastructure as Code framework
     """
     
-    temp_file = create_test_resume(resume, "design_resume.txt")
-    try:
-        result = parse_resume(temp_file)
-        print(f"✓ Skills Found: {len(result['skills'])} skills")
-        print(f"  Top Skills: {', '.join(result['skills'][:6])}")
-        print(f"✓ Education: {len(result['education'])} degree(s)")
-        print(f"✓ Experience: {result['experience_months']} months (approx)")
-        print(f"✓ Projects: {result['projects_count']} projects")
-        print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
-        return result
-    finally:
-        Path(temp_file).unlink()
+    result = parse_resume_text(resume)
+    print(f"✓ Skills Found: {len(result['skills'])} skills")
+    print(f"  Top Skills: {', '.join(result['skills'][:6])}")
+    print(f"✓ Education: {len(result['education'])} degree(s)")
+    print(f"✓ Experience: {result['experience_months']} months (approx)")
+    print(f"✓ Projects: {result['projects_count']} projects")
+    print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
+    return result
 
 
 def test_academic_cv():
@@ -197,17 +176,13 @@ Research Projects:
 - Created benchmark dataset for NLP tasks
     """
     
-    temp_file = create_test_resume(resume, "academic_cv.txt")
-    try:
-        result = parse_resume(temp_file)
-        print(f"✓ Skills Found: {len(result['skills'])} skills")
-        print(f"  Top Skills: {', '.join(result['skills'][:8])}")
-        print(f"✓ Education: {len(result['education'])} degree(s)")
-        print(f"✓ Projects: {result['projects_count']} projects")
-        print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
-        return result
-    finally:
-        Path(temp_file).unlink()
+    result = parse_resume_text(resume)
+    print(f"✓ Skills Found: {len(result['skills'])} skills")
+    print(f"  Top Skills: {', '.join(result['skills'][:8])}")
+    print(f"✓ Education: {len(result['education'])} degree(s)")
+    print(f"✓ Projects: {result['projects_count']} projects")
+    print(f"✓ Completeness: {result['resume_completeness_score']:.0%}")
+    return result
 
 
 def main():
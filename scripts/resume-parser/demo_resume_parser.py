@@ -3,9 +3,9 @@ Demo: Resume Parser - Complete Working Examples
 This script demonstrates all features of the resume parser.
 """
 
-import json
 from io import StringIO
-from resume_parser import ResumeParser, parse_resume
+from resume_parser import pretty_json
+from resume_parser_old import ResumeParser
 
 
 def demo_1_basic_parsing():
@@ -58,9 +58,7 @@ def demo_1_basic_parsing():
     """
 
     # Parse using the ResumeParser class
-    parser = ResumeParser.__new__(ResumeParser)
-    parser.text = resume_text
-    parser.lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
+    parser = ResumeParser.from_text(resume_text)
 
     print("\n📄 EXTRACTED RESUME DATA:\n")
 
@@ -114,9 +112,7 @@ def demo_2_skill_extraction():
     - Git, Jenkins, CircleCI, Terraform
     """
 
-    parser = ResumeParser.__new__(ResumeParser)
-    parser.text = resume_text
-    parser.lines = resume_text.split('\n')
+    parser = ResumeParser.from_text(resume_text)
 
     skills = parser.extract_skills()
 
@@ -163,9 +159,7 @@ def demo_3_experience_calculation():
     ]
 
     for test in test_cases:
-        parser = ResumeParser.__new__(ResumeParser)
-        parser.text = test['text']
-        parser.lines = test['text'].split('\n')
+        parser = ResumeParser.from_text(test['text'])
         
         months = parser.extract_experience_months()
         years = months / 12 if months > 0 else 0
@@ -229,9 +223,7 @@ def demo_4_completeness_scoring():
 
     print("\n")
     for test in test_cases:
-        parser = ResumeParser.__new__(ResumeParser)
-        parser.text = test['text']
-        parser.lines = [line.strip() for line in test['text'].split('\n') if line.strip()]
+        parser = ResumeParser.from_text(test['text'])
         
         score = parser.calculate_completeness_score()
         rating = "Excellent" if score >= 0.9 else "Good" if score >= 0.75 else "Average" if score >= 0.6 else "Needs Improvement"
@@ -265,14 +257,12 @@ def demo_5_json_output():
     Created ML service
     """
 
-    parser = ResumeParser.__new__(ResumeParser)
-    parser.text = resume_text
-    parser.lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
+    parser = ResumeParser.from_text(resume_text)
 
     result = parser.parse()
 
     print("\nJSON Output:")
-    print(json.dumps(result, indent=2))
+    print(pretty_json(result))
 
 
 def demo_6_edge_cases():
@@ -306,9 +296,7 @@ def demo_6_edge_cases():
 
     for case in cases:
         print(f"\n{case['name']}:")
-        parser = ResumeParser.__new__(ResumeParser)
-        parser.text = case['text']
-        parser.lines = [line.strip() for line in case['text'].split('\n') if line.strip()]
+        parser = ResumeParser.from_text(case['text'])
         
         try:
             skills = parser.extract_skills()
@@ -370,9 +358,7 @@ def demo_7_validation():
     - Mentoring: Guided 10+ junior engineers
     """
 
-    parser = ResumeParser.__new__(ResumeParser)
-    parser.text = resume_text
-    parser.lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
+    parser = ResumeParser.from_text(resume_text)
 
     result = parser.parse()
 
@@ -399,6 +385,30 @@ def demo_7_validation():
     print(f"   Projects: {result['projects_count']}")
 
 
+def demo_8_batch_parsing():
+    """Demo 8: Parse several resumes in one batch call."""
+    print("\n" + "="*70)
+    print("DEMO 8: BATCH PARSING")
+    print("="*70)
+
+    texts = [
+        "Skills: Python, Django, PostgreSQL, Docker\nProjects:\n- Blog platform",
+        "Skills: JavaScript, React, Node.js, MongoDB\nProjects:\n- Chat app\n- Portfolio",
+        "Skills: Python, Pandas, TensorFlow, SQL",
+        "Skills: Python, Django, PostgreSQL, Docker\nProjects:\n- Blog platform",
+    ]
+
+    results = ResumeParser.parse_many(texts)
+
+    print(f"\nParsed {len(texts)} resumes ({len(set(texts))} unique):\n")
+    for i, result in enumerate(results, 1):
+        print(f"  Resume {i}: {len(result['skills'])} skills, "
+              f"{result['projects_count']} project(s), "
+              f"completeness {result['resume_completeness_score']:.0%}")
+
+    return results
+
+
 def main():
     """Run all demos."""
     print("\n")
@@ -416,6 +426,7 @@ def main():
         demo_5_json_output,
         demo_6_edge_cases,
         demo_7_validation,
+        demo_8_batch_parsing,
     ]
 
     for demo in demos:
@@ -4,15 +4,304 @@ Complete backend integration showing how to use the resume parser
 in the HirePulse application for user profile completion.
 """
 
-import json
+import hashlib
 import os
+import re
 import tempfile
-from datetime import datetime
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
 from pathlib import Path
 
 # Import resume parser
-from resume_parser import parse_resume, ResumeParser
+from resume_parser import json_bytes, json_loads, parse_resume, pretty_json, ResumeParser
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+# Job pools at least this large are scored with NumPy (a plain loop is faster below it)
+VECTORIZE_MIN_JOBS = 50
+
+# Without NumPy, job pools at least this large are matched across worker processes
+# (below it, process start-up costs more than the matching)
+PARALLEL_MIN_JOBS = 10_000
+
+# Skill category keywords, in priority order: a skill goes to the first
+# category that has any keyword occurring in it (substring match)
+SKILL_CATEGORY_KEYWORDS = [
+    ('programming', ['python', 'java', 'javascript', 'typescript', 'c#', 'go', 'rust']),
+    ('frameworks', ['react', 'angular', 'vue', 'django', 'flask', 'spring']),
+    ('databases', ['sql', 'postgres', 'mongo', 'redis', 'elastic']),
+    ('tools', ['docker', 'kubernetes', 'aws', 'git', 'jenkins']),
+]
+
+
+def _build_category_matcher():
+    """
+    Build a function returning the best (lowest) category rank of any keyword
+    occurring in a lowercased skill, or None. All keywords are matched in one
+    pass over the skill instead of one substring scan per keyword.
+    """
+    if HAS_AHOCORASICK:
+        ranks = {}
+        for rank, (_, keywords) in enumerate(SKILL_CATEGORY_KEYWORDS):
+            for kw in keywords:
+                ranks.setdefault(kw, rank)
+
+        automaton = ahocorasick.Automaton()
+        for kw, rank in ranks.items():
+            automaton.add_word(kw, rank)
+        automaton.make_automaton()
+
+        def best_rank(skill_lower: str) -> Optional[int]:
+            return min((rank for _, rank in automaton.iter(skill_lower)), default=None)
+
+        return best_rank
+
+    # One precompiled union with a named group per category, in priority
+    # order, inside a lookahead: every position is tried, and at each one the
+    # highest-priority keyword starting there is reported
+    category_re = re.compile('(?=' + '|'.join(
+        f'(?P<{name}>' + '|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))) + ')'
+        for name, keywords in SKILL_CATEGORY_KEYWORDS
+    ) + ')')
+    group_ranks = {name: rank for rank, (name, _) in enumerate(SKILL_CATEGORY_KEYWORDS)}
+
+    def best_rank(skill_lower: str) -> Optional[int]:
+        best = None
+        for m in category_re.finditer(skill_lower):
+            rank = group_ranks[m.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return best
+
+    return best_rank
+
+
+_category_rank = _build_category_matcher()
+
+
+def _now_iso() -> str:
+    """Local time as an ISO 8601 string, to the second."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+
+
+def _content_hash(data: bytes) -> str:
+    """Hex digest identifying a resume file's contents."""
+    if HAS_XXHASH:
+        return xxhash.xxh3_64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Process-wide skill vocabulary: normalized skill name <-> small integer ID.
+# Matching works on frozensets of IDs; names are looked up only for output.
+# IDs stay valid for the life of the process (prepared jobs keep theirs), so
+# entries are never evicted: the table holds one short string per distinct
+# skill name seen, which is bounded by the skill dictionary plus free-form
+# skills from parsed resumes and job postings. Long-running services that
+# ingest unbounded free-form skills should be restarted periodically.
+_VOCAB: Dict[str, int] = {}
+_SKILL_NAMES: List[str] = []
+_VOCAB_LOCK = threading.Lock()
+
+
+def _intern(skill: str) -> int:
+    """Integer ID of a skill, compared case- and whitespace-insensitively."""
+    key = skill.strip().lower()
+    sid = _VOCAB.get(key)
+    if sid is None:
+        # Re-check under the lock so two threads can't give one name two IDs
+        with _VOCAB_LOCK:
+            sid = _VOCAB.get(key)
+            if sid is None:
+                _SKILL_NAMES.append(key)
+                sid = _VOCAB[key] = len(_SKILL_NAMES) - 1
+    return sid
+
+
+def _skill_ids(skills) -> frozenset:
+    """Interned ID set of a skill list, used for matching."""
+    return frozenset(map(_intern, skills))
+
+
+def _skill_names(ids) -> List[str]:
+    """Normalized skill names for a collection of skill IDs."""
+    return list(map(_SKILL_NAMES.__getitem__, ids))
+
+
+def prepare_job(job: Dict) -> Dict:
+    """
+    Precompute a job's required skill IDs (call once at job ingest).
+    
+    match_jobs and get_recommended_jobs reuse job['_skill_ids'] when present
+    instead of re-normalizing the requirements on every match.
+    """
+    job['_skill_ids'] = _skill_ids(job.get('required_skills', ()))
+    return job
+
+
+def _job_skills(job: Dict) -> frozenset:
+    """A job's required skill IDs, precomputed by prepare_job when available."""
+    skills = job.get('_skill_ids')
+    if skills is None:
+        skills = _skill_ids(job.get('required_skills', ()))
+    return skills
+
+
+def _recommendation_for(match_score: float) -> str:
+    """Recommendation text for a (capped, unrounded) match score."""
+    if match_score >= 0.85:
+        return 'Strong match - Highly recommended'
+    elif match_score >= 0.7:
+        return 'Good match - Apply'
+    elif match_score >= 0.5:
+        return 'Moderate match - Consider applying'
+    else:
+        return 'Weak match - May not meet requirements'
+
+
+def _match_job(resume_data: Dict, candidate_skills: frozenset, job_requirements: Dict,
+               required_skills: frozenset) -> Dict:
+    """Match score and details of one job, given candidate and job skill IDs."""
+    match_score = 0.0
+    details = {
+        'skills_match': 0.0,
+        'experience_match': 0.0,
+        'education_match': 0.0,
+        'matched_skills': [],
+        'missing_skills': [],
+        'recommendation': ''
+    }
+
+    # Skills matching
+    matched = required_skills & candidate_skills
+    missing = required_skills - candidate_skills
+    
+    details['matched_skills'] = _skill_names(matched)
+    details['missing_skills'] = _skill_names(missing)
+    
+    if required_skills:
+        details['skills_match'] = len(matched) / len(required_skills)
+        match_score += details['skills_match'] * 0.5
+
+    # Experience matching
+    min_experience = job_requirements.get('min_experience_months', 0)
+    if resume_data['experience_months'] >= min_experience:
+        details['experience_match'] = 1.0
+        match_score += 0.3
+    else:
+        details['experience_match'] = resume_data['experience_months'] / max(min_experience, 1)
+        match_score += details['experience_match'] * 0.3
+
+    # Education matching
+    required_degree = job_requirements.get('required_degree')
+    if required_degree and resume_data['education']:
+        if any(required_degree.lower() in edu['degree'].lower() 
+               for edu in resume_data['education']):
+            details['education_match'] = 1.0
+            match_score += 0.2
+
+    # Generate recommendation
+    match_score = min(match_score, 1.0)
+    details['recommendation'] = _recommendation_for(match_score)
+
+    return {
+        'match_score': round(match_score, 2),
+        'details': details
+    }
+
+
+def _match_job_in_worker(resume_data: Dict, job_requirements: Dict) -> Dict:
+    """
+    _match_job for a worker process. Skill IDs are process-local, so they are
+    interned again from the skill names rather than taken from the inputs.
+    """
+    return _match_job(resume_data, _skill_ids(resume_data['skills']), job_requirements,
+                      _skill_ids(job_requirements.get('required_skills', ())))
+
+
+class JobSkillIndex:
+    """
+    Job requirements laid out as flat arrays so one candidate can be scored
+    against every job with a few NumPy operations instead of a Python loop.
+    
+    Build it once when jobs are posted and pass it to get_recommended_jobs
+    in place of the job list. Scores equal match_jobs' exactly.
+    """
+
+    def __init__(self, jobs: list):
+        self.jobs = list(jobs)
+        self.skill_sets = [_job_skills(job) for job in self.jobs]
+        self.vocab: Dict[int, int] = {}
+
+        # Sparse jobs x vocab occurrence matrix as (row, column) pairs
+        rows, cols = [], []
+        for row, skills in enumerate(self.skill_sets):
+            for skill in skills:
+                cols.append(self.vocab.setdefault(skill, len(self.vocab)))
+                rows.append(row)
+        self._rows = np.asarray(rows, dtype=np.intp)
+        self._cols = np.asarray(cols, dtype=np.intp)
+        self.required_counts = np.bincount(self._rows, minlength=len(self.jobs)).astype(np.float64)
+
+        self.min_months = np.array(
+            [job.get('min_experience_months', 0) for job in self.jobs], dtype=np.float64
+        )
+
+        # Job rows grouped by required degree, so each distinct degree is checked once
+        degree_rows: Dict[str, list] = {}
+        for row, job in enumerate(self.jobs):
+            degree = job.get('required_degree')
+            if degree:
+                degree_rows.setdefault(degree, []).append(row)
+        self._degree_rows = {d: np.asarray(r, dtype=np.intp) for d, r in degree_rows.items()}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def match_scores(self, candidate_skills: frozenset, experience_months, education: list):
+        """Capped, unrounded match score of the candidate for every job."""
+        n_jobs = len(self.jobs)
+
+        # Skills: matched = J @ c, as a bincount over the sparse entries
+        candidate = np.zeros(len(self.vocab), dtype=np.float64)
+        candidate[[self.vocab[s] for s in candidate_skills if s in self.vocab]] = 1.0
+        matched = np.bincount(self._rows, weights=candidate[self._cols], minlength=n_jobs)
+        skills_match = np.divide(matched, self.required_counts,
+                                 out=np.zeros(n_jobs), where=self.required_counts > 0)
+        scores = skills_match * 0.5
+
+        # Experience
+        scores += np.where(experience_months >= self.min_months, 0.3,
+                           (experience_months / np.maximum(self.min_months, 1)) * 0.3)
+
+        # Education
+        if education:
+            for degree, rows in self._degree_rows.items():
+                if any(degree.lower() in edu['degree'].lower() for edu in education):
+                    scores[rows] += 0.2
+
+        return np.minimum(scores, 1.0)
 
 
 class HirePulseResumeIntegration:
@@ -37,18 +326,28 @@ class HirePulseResumeIntegration:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Resume file not found: {file_path}")
 
+        uploaded_at = _now_iso()
+
         try:
+            # Identical files (re-uploads) reuse the earlier parse
+            cache_path = self.uploads_dir / f"cache_{_content_hash(Path(file_path).read_bytes())}.json"
+            result = self._load_cached_parse(cache_path)
+            cache_hit = result is not None
+            
             # Parse resume
-            result = parse_resume(file_path)
+            if not cache_hit:
+                result = parse_resume(file_path)
             
             # Add metadata
             result['user_id'] = self.user_id
             result['filename'] = Path(file_path).name
-            result['uploaded_at'] = datetime.now().isoformat()
+            result['uploaded_at'] = uploaded_at
             result['status'] = 'parsed'
             
             # Store parsed data
-            self._store_resume_data(result)
+            filepath = self._store_resume_data(result)
+            if not cache_hit:
+                self._link_cache_entry(filepath, cache_path)
             
             return result
         
@@ -57,7 +356,7 @@ class HirePulseResumeIntegration:
                 'user_id': self.user_id,
                 'status': 'error',
                 'error': str(e),
-                'uploaded_at': datetime.now().isoformat()
+                'uploaded_at': uploaded_at
             }
 
     def get_profile_suggestions(self, resume_data: Dict) -> Dict:
@@ -128,79 +427,41 @@ class HirePulseResumeIntegration:
         Returns:
             Match score and detailed analysis
         """
-        match_score = 0.0
-        details = {
-            'skills_match': 0.0,
-            'experience_match': 0.0,
-            'education_match': 0.0,
-            'matched_skills': [],
-            'missing_skills': [],
-            'recommendation': ''
-        }
+        return self._match_normalized(resume_data, _skill_ids(resume_data['skills']), job_requirements)
 
-        # Skills matching
-        required_skills = set(skill.lower() for skill in job_requirements.get('required_skills', []))
-        candidate_skills = set(skill.lower() for skill in resume_data['skills'])
-        
-        matched = required_skills & candidate_skills
-        missing = required_skills - candidate_skills
-        
-        details['matched_skills'] = list(matched)
-        details['missing_skills'] = list(missing)
-        
-        if required_skills:
-            details['skills_match'] = len(matched) / len(required_skills)
-            match_score += details['skills_match'] * 0.5
-
-        # Experience matching
-        min_experience = job_requirements.get('min_experience_months', 0)
-        if resume_data['experience_months'] >= min_experience:
-            details['experience_match'] = 1.0
-            match_score += 0.3
-        else:
-            details['experience_match'] = resume_data['experience_months'] / max(min_experience, 1)
-            match_score += details['experience_match'] * 0.3
-
-        # Education matching
-        required_degree = job_requirements.get('required_degree')
-        if required_degree and resume_data['education']:
-            if any(required_degree.lower() in edu['degree'].lower() 
-                   for edu in resume_data['education']):
-                details['education_match'] = 1.0
-                match_score += 0.2
-
-        # Generate recommendation
-        match_score = min(match_score, 1.0)
-        if match_score >= 0.85:
-            details['recommendation'] = 'Strong match - Highly recommended'
-        elif match_score >= 0.7:
-            details['recommendation'] = 'Good match - Apply'
-        elif match_score >= 0.5:
-            details['recommendation'] = 'Moderate match - Consider applying'
-        else:
-            details['recommendation'] = 'Weak match - May not meet requirements'
+    def _match_normalized(self, resume_data: Dict, candidate_skills: frozenset, job_requirements: Dict) -> Dict:
+        """match_jobs with the candidate's skill IDs already computed."""
+        return _match_job(resume_data, candidate_skills, job_requirements, _job_skills(job_requirements))
 
-        return {
-            'match_score': round(match_score, 2),
-            'details': details
-        }
-
-    def get_recommended_jobs(self, resume_data: Dict, available_jobs: list) -> list:
+    def get_recommended_jobs(self, resume_data: Dict, available_jobs) -> list:
         """
         Get recommended jobs for candidate.
         
         Args:
             resume_data: Parsed resume data
-            available_jobs: List of job postings
+            available_jobs: List of job postings, or a JobSkillIndex built from them
             
         Returns:
             Ranked list of recommended jobs
         """
+        # Intern the candidate's skills once, not once per job
+        candidate_skills = _skill_ids(resume_data['skills'])
+
+        if isinstance(available_jobs, JobSkillIndex) or (
+                HAS_NUMPY and len(available_jobs) >= VECTORIZE_MIN_JOBS):
+            return self._recommend_vectorized(resume_data, candidate_skills, available_jobs)
+
+        if len(available_jobs) >= PARALLEL_MIN_JOBS:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                matches = list(executor.map(partial(_match_job_in_worker, resume_data),
+                                            available_jobs, chunksize=64))
+        else:
+            matches = [self._match_normalized(resume_data, candidate_skills, job)
+                       for job in available_jobs]
+
         recommendations = []
 
-        for job in available_jobs:
-            match = self.match_jobs(resume_data, job)
-            
+        for job, match in zip(available_jobs, matches):
             recommendation = {
                 'job_id': job['id'],
                 'job_title': job['title'],
@@ -217,6 +478,33 @@ class HirePulseResumeIntegration:
         
         return recommendations[:10]  # Top 10
 
+    def _recommend_vectorized(self, resume_data: Dict, candidate_skills: frozenset, available_jobs) -> list:
+        """get_recommended_jobs scoring every job in one pass over a JobSkillIndex."""
+        index = available_jobs if isinstance(available_jobs, JobSkillIndex) else JobSkillIndex(available_jobs)
+        if not len(index):
+            return []
+
+        scores = index.match_scores(candidate_skills, resume_data['experience_months'], resume_data['education'])
+
+        # Rank on the rounded score like match_jobs reports it; the stable sort
+        # keeps posting order for ties
+        rounded = np.array([round(score, 2) for score in scores.tolist()])
+        top = np.argsort(-rounded, kind='stable')[:10]
+
+        recommendations = []
+        for i in top.tolist():
+            job = index.jobs[i]
+            recommendations.append({
+                'job_id': job['id'],
+                'job_title': job['title'],
+                'company': job['company'],
+                'match_score': float(rounded[i]),
+                'recommendation': _recommendation_for(float(scores[i])),
+                'missing_skills': _skill_names(index.skill_sets[i] - candidate_skills)[:3]  # Top 3
+            })
+
+        return recommendations
+
     def generate_profile_report(self, resume_data: Dict) -> Dict:
         """
         Generate comprehensive profile report.
@@ -255,7 +543,7 @@ class HirePulseResumeIntegration:
                 'interpretation': self._interpret_projects(resume_data['projects_count'])
             },
             'recommendations': self.get_profile_suggestions(resume_data),
-            'generated_at': datetime.now().isoformat()
+            'generated_at': _now_iso()
         }
 
     def _rate_quality(self, score: float) -> str:
@@ -281,23 +569,12 @@ class HirePulseResumeIntegration:
             'other': []
         }
 
-        prog_keywords = ['python', 'java', 'javascript', 'typescript', 'c#', 'go', 'rust']
-        framework_keywords = ['react', 'angular', 'vue', 'django', 'flask', 'spring']
-        db_keywords = ['sql', 'postgres', 'mongo', 'redis', 'elastic']
-        tool_keywords = ['docker', 'kubernetes', 'aws', 'git', 'jenkins']
-
         for skill in skills:
-            skill_lower = skill.lower()
-            if any(kw in skill_lower for kw in prog_keywords):
-                categories['programming'].append(skill)
-            elif any(kw in skill_lower for kw in framework_keywords):
-                categories['frameworks'].append(skill)
-            elif any(kw in skill_lower for kw in db_keywords):
-                categories['databases'].append(skill)
-            elif any(kw in skill_lower for kw in tool_keywords):
-                categories['tools'].append(skill)
-            else:
+            rank = _category_rank(skill.lower())
+            if rank is None:
                 categories['other'].append(skill)
+            else:
+                categories[SKILL_CATEGORY_KEYWORDS[rank][0]].append(skill)
 
         return {k: v for k, v in categories.items() if v}
 
@@ -326,15 +603,44 @@ class HirePulseResumeIntegration:
         else:
             return "Multiple projects showcased"
 
-    def _store_resume_data(self, data: Dict):
+    def _load_cached_parse(self, cache_path: Path) -> Optional[Dict]:
+        """Previously parsed data for the same file contents, if any."""
+        try:
+            raw = cache_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            data = json_loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or data.get('status') != 'parsed':
+            return None
+        return data
+
+    def _link_cache_entry(self, filepath: Path, cache_path: Path):
+        """Make the stored parse reachable by content hash (hard link, copy as fallback)."""
+        try:
+            os.link(filepath, cache_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            # e.g. filesystems without hard links
+            cache_path.write_bytes(filepath.read_bytes())
+
+    def _store_resume_data(self, data: Dict) -> Path:
         """Store parsed resume data."""
         # In production, this would save to database
         # For now, save to JSON file
-        filename = f"{self.user_id}_resume_{datetime.now().timestamp()}.json"
+        filename = f"{self.user_id}_resume_{time.time()}.json"
         filepath = self.uploads_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = json_bytes(data, indent=True)
+        
+        # Write to a temp file and rename, so readers never see a partial file
+        tmp_path = self.uploads_dir / f".{filename}.tmp"
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, filepath)
+        return filepath
 
 
 # Example usage
@@ -374,14 +680,14 @@ if __name__ == "__main__":
     # Get profile suggestions
     suggestions = integration.get_profile_suggestions(sample_resume_data)
     print("Profile Suggestions:")
-    print(json.dumps(suggestions, indent=2))
+    print(pretty_json(suggestions))
 
     # Match job
     match = integration.match_jobs(sample_resume_data, sample_job)
     print("\nJob Match:")
-    print(json.dumps(match, indent=2))
+    print(pretty_json(match))
 
     # Generate report
     report = integration.generate_profile_report(sample_resume_data)
     print("\nProfile Report:")
-    print(json.dumps(report, indent=2))
+    print(pretty_json(report))
@@ -2,16 +2,33 @@
 """
 Resume Parser Script
 Extracts structured information from PDF/DOCX resumes using heuristics and regex.
+
+Modes:
+    python resume_parser.py <file_path>   # one-shot: parse one file, print JSON, exit
+    python resume_parser.py --serve       # persistent worker: import and build the skill
+                                          # tables once, then parse each path read from
+                                          # stdin and answer with one JSON line on stdout
 """
 
 import sys
+import io
 import json
 import os
 import re
+import hashlib
+import functools
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 
 # Try to import PDF libraries, but don't fail if not available
+try:
+    import fitz  # PyMuPDF
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
 try:
     import PyPDF2
     HAS_PYPDF2 = True
@@ -24,6 +41,442 @@ try:
 except ImportError:
     HAS_DOCX = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Section, degree, duration and project patterns run on the lower-cased text, so they are
+# compiled without re.IGNORECASE
+_SECTION_KEYWORD_RE = re.compile(r'skills?|experience|education|projects?|certification')
+_HEADER_GAP_RE = re.compile(r'\s*:?\s*')
+_DEGREE_RE = re.compile(r'(bachelor|masters|phd|doctorate|diploma|certificate|b\.s|b\.a|m\.s|m\.a|m\.b\.a|mba)\s*(?:of|in)?\s*([^,\n\.]*)')
+_DURATION_RE = re.compile(r'(\d+)\+?\s*(?:years|yrs|years?)\s*(?:of\s+)?experience')
+_PROJECT_INDICATOR_RE = re.compile(r'github|gitlab|project|built|developed|created|designed')
+
+# Patterns run on the original-case text
+_INSTITUTION_RE = re.compile(r'(?:university|college|school|institute)\s+(?:of\s+)?([^,\n\.]+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Skills-section cleanup
+_CID_RE = re.compile(r"\(cid:\d+\)")
+_LEAD_PUNCT_RE = re.compile(r"^[^A-Za-z0-9]+")
+# Delimiters between skill items, all folded into ','
+_DELIM_TABLE = str.maketrans({';': ',', '/': ',', '|': ','})
+_WORD_RE = re.compile(r"\w+")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Integer environment setting; malformed values fall back to the default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"Warning: Ignoring {name}={value!r}, using {default}", file=sys.stderr)
+        return default
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache location, so parse results never land in the working directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "resume_parser"
+
+
+# Parse results of resume files are cached on disk keyed by file content; bump the
+# version whenever a change to the parser would alter its output. Entries hold
+# candidate data, so they live in a private per-user directory and the location
+# and size are configurable: past CACHE_MAX_ENTRIES the oldest entries are
+# deleted, and 0 disables the cache.
+CACHE_DIR = Path(os.environ.get("RESUME_PARSER_CACHE_DIR") or _default_cache_dir())
+CACHE_MAX_ENTRIES = _env_int("RESUME_PARSER_CACHE_MAX_ENTRIES", 500)
+CACHE_VERSION = 2
+
+
+def _fingerprint(data: bytes) -> str:
+    """Hex digest identifying a resume file's contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _file_fingerprint(file_path: str) -> Optional[str]:
+    """Hex digest of a file's bytes, or None if it cannot be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            return _fingerprint(f.read())
+    except OSError:
+        return None
+
+
+def _cache_path(fingerprint: str) -> Path:
+    return CACHE_DIR / f"v{CACHE_VERSION}-{fingerprint}.json"
+
+
+def json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON, compact or indented by two spaces."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def pretty_json(obj: Any) -> str:
+    """Indented JSON for display."""
+    return json_bytes(obj, indent=True).decode('utf-8')
+
+
+def _print_json(obj: Any):
+    """Write obj to stdout as one line of JSON."""
+    if HAS_ORJSON:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj))
+
+
+@functools.lru_cache(maxsize=256)
+def _read_cache_file(path: str, mtime_ns: int) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _read_cached_result(fingerprint: str) -> bytes:
+    """
+    JSON of a previously cached parse result.
+
+    Raises OSError on a miss. Entry contents are memoized per file version,
+    so an entry deleted by _prune_cache (in this or another process) is a
+    miss rather than being served from memory.
+    """
+    path = _cache_path(fingerprint)
+    return _read_cache_file(str(path), path.stat().st_mtime_ns)
+
+
+def _write_cached_result(fingerprint: str, result: Dict[str, Any]):
+    """Store a parse result atomically; caching is best-effort."""
+    path = _cache_path(fingerprint)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp.write_bytes(json_bytes(result))
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Warning: Could not write parse cache: {e}", file=sys.stderr)
+        return
+    _prune_cache()
+
+
+def _prune_cache():
+    """Delete the oldest cache entries beyond CACHE_MAX_ENTRIES."""
+    entries = []
+    try:
+        for entry in os.scandir(CACHE_DIR):
+            if entry.name.endswith('.json'):
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+    except OSError:
+        return
+
+    entries.sort()
+    for _, path in entries[:max(len(entries) - CACHE_MAX_ENTRIES, 0)]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# Headings of the sections the extractors read; substrings, as in _SECTION_RULES
+_SECTION_HEADINGS = ('skill', 'education', 'experience', 'project')
+
+
+def _take_pages(pages: Iterator[str], stop_after_sections: bool) -> List[str]:
+    """
+    Page texts in order; with stop_after_sections, stop after the first page
+    by which every section heading has appeared.
+    """
+    taken = []
+    missing = set(_SECTION_HEADINGS)
+    for page in pages:
+        taken.append(page)
+        if stop_after_sections:
+            page_lower = page.lower()
+            missing = {heading for heading in missing if heading not in page_lower}
+            if not missing:
+                break
+    return taken
+
+
+def _fitz_pages(source: Union[str, bytes]) -> Iterator[str]:
+    doc = fitz.open(stream=source, filetype='pdf') if isinstance(source, bytes) else fitz.open(source)
+    with doc:
+        for page in doc:
+            yield page.get_text("text")
+
+
+def _pypdf2_pages(source: Union[str, bytes]) -> Iterator[str]:
+    with (io.BytesIO(source) if isinstance(source, bytes) else open(source, 'rb')) as file:
+        for page in PyPDF2.PdfReader(file).pages:
+            yield page.extract_text()
+
+
+def _read_pdf_text(source: Union[str, bytes], stop_after_sections: bool = False) -> str:
+    """
+    Text of a PDF given as a path or as its bytes, preferring PyMuPDF and
+    falling back to PyPDF2.
+
+    Pages are decoded lazily, so with stop_after_sections the remaining pages
+    are never parsed.
+    """
+    if HAS_FITZ:
+        try:
+            return "\n".join(_take_pages(_fitz_pages(source), stop_after_sections))
+        except Exception as e:
+            print(f"Warning: PyMuPDF extraction failed, trying PyPDF2: {e}", file=sys.stderr)
+
+    if not HAS_PYPDF2:
+        return ""
+
+    try:
+        return "".join(page + "\n" for page in _take_pages(_pypdf2_pages(source), stop_after_sections))
+    except Exception as e:
+        print(f"Warning: Could not extract from PDF: {e}", file=sys.stderr)
+        return ""
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_pdf_cached(file_path: str, mtime_ns: int, size: int, stop_after_sections: bool = False) -> str:
+    """
+    _read_pdf_text of a file, memoized on (path, mtime, size) so re-parsing an
+    unchanged file in the same process skips decoding the page content
+    streams again.
+    """
+    return _read_pdf_text(file_path, stop_after_sections)
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def _docx_run_text(run: ET.Element) -> str:
+    """Text of a w:r element, with tabs and line breaks as python-docx renders them."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + 't':
+            parts.append(child.text or "")
+        elif tag in (_W + 'tab', _W + 'ptab'):
+            parts.append("\t")
+        elif tag == _W + 'cr' or (tag == _W + 'br' and child.get(_W + 'type', 'textWrapping') == 'textWrapping'):
+            parts.append("\n")
+        elif tag == _W + 'noBreakHyphen':
+            parts.append("-")
+    return "".join(parts)
+
+
+def _docx_paragraph_text(paragraph: ET.Element) -> str:
+    """Text of a w:p element's runs, including runs inside hyperlinks."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W + 'r':
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W + 'hyperlink':
+            parts.extend(_docx_run_text(run) for run in child.iterfind(_W + 'r'))
+    return "".join(parts)
+
+
+def _read_docx_xml_text(source: Union[str, bytes]) -> str:
+    """
+    Text of a DOCX read straight from word/document.xml: one line per body
+    paragraph, like "\n".join(p.text for p in Document(...).paragraphs), but
+    parsing only that part with the C XML parser instead of loading the whole
+    package into python-docx's object model.
+    """
+    with zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source) as z:
+        root = ET.fromstring(z.read('word/document.xml'))
+    body = root.find(_W + 'body')
+    if body is None:
+        raise ValueError("word/document.xml has no body")
+    return "\n".join(_docx_paragraph_text(p) for p in body.iterfind(_W + 'p'))
+
+
+# Leading filler words dropped from free-form skill items
+_LEAD_STOPWORDS = frozenset({"and", "with", "in", "for", "of", "to", "the", "a", "an", "skilled", "proficient"})
+# Section headings that are not skills themselves
+_HEADING_WORDS = frozenset({"skills", "skill", "experience", "internship", "projects", "education"})
+
+
+def _parse_skill_lines(skills_text: str) -> set:
+    """Free-form skill items from the bullet/line layout of a (lower-cased) skills section."""
+    skills = set()
+    for line in skills_text.splitlines():
+        cleaned_line = _LEAD_PUNCT_RE.sub("", line).strip()
+        if not cleaned_line:
+            continue
+
+        # Split on common delimiters inside the line
+        for raw in cleaned_line.translate(_DELIM_TABLE).split(','):
+            candidate = raw.strip().strip('.').strip()
+            if not candidate:
+                continue
+
+            words = candidate.split()
+            start = 0
+            while start < len(words) and (len(words[start]) <= 2 or words[start] in _LEAD_STOPWORDS):
+                start += 1
+
+            if not 0 < len(words) - start <= 6:
+                continue
+
+            candidate_clean = " ".join(words[start:])
+            if candidate_clean in _HEADING_WORDS:
+                continue
+
+            # candidate_clean is already single-space joined
+            skills.add(candidate_clean.title())
+    return skills
+
+
+# Section name -> (heading keywords, keywords that end the section). A section
+# is the text after a heading (and optional colon) up to the next terminator
+# or the end, e.g. skills is r'skills?\s*:?\s*(.*?)(?:experience|education|projects|certification|$)'
+# with re.DOTALL.
+_SECTION_RULES = {
+    'skills': (frozenset({'skill', 'skills'}),
+               frozenset({'experience', 'education', 'projects', 'certification'})),
+    'education': (frozenset({'education'}),
+                  frozenset({'experience', 'skills', 'projects', 'certification'})),
+    'projects': (frozenset({'project', 'projects'}),
+                 frozenset({'experience', 'skills', 'education'})),
+}
+
+
+def _find_sections(text: str) -> Dict[str, List[str]]:
+    """
+    Bodies of every skills/education/projects section in text, per section,
+    as re.findall would return them for the patterns in _SECTION_RULES.
+
+    All section keywords are located in one scan; keywords can only overlap
+    at their last character (e.g. "projectskills"), so each search restarts
+    one character after the previous hit. The lazy section bodies are then
+    cut out of the keyword list instead of re-scanning the text per section.
+    """
+    keywords = []
+    m = _SECTION_KEYWORD_RE.search(text)
+    while m:
+        keywords.append((m.start(), m.end(), m.group()))
+        m = _SECTION_KEYWORD_RE.search(text, m.start() + 1)
+
+    # Without re.MULTILINE, $ also matches just before a trailing newline
+    last = len(text) - 1 if text.endswith('\n') else len(text)
+
+    sections = {}
+    for name, (headings, terminators) in _SECTION_RULES.items():
+        bodies = []
+        pos = 0
+        i = 0
+        while True:
+            while i < len(keywords) and (keywords[i][0] < pos or keywords[i][2] not in headings):
+                i += 1
+            if i == len(keywords):
+                break
+            body_start = _HEADER_GAP_RE.match(text, keywords[i][1]).end()
+            j = i + 1
+            while j < len(keywords) and (keywords[j][0] < body_start or keywords[j][2] not in terminators):
+                j += 1
+            end = last if body_start <= last else len(text)
+            if j < len(keywords) and keywords[j][0] < end:
+                bodies.append(text[body_start:keywords[j][0]])
+                pos = keywords[j][1]
+            else:
+                bodies.append(text[body_start:end])
+                pos = end
+        sections[name] = bodies
+    return sections
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same notion of a word character as re's \\b on str patterns."""
+    return ch.isalnum() or ch == '_'
+
+
+def _build_skill_finder(skills: List[str]):
+    """
+    Return find(text) giving every skill that occurs in text as a whole word,
+    i.e. each skill for which re.search(rf'\\b{re.escape(skill)}\\b', text) matches.
+
+    Skills made only of word characters (most of them) match exactly when they
+    equal a maximal \\w+ run, so they are found by intersecting a fixed set with
+    the text's tokens. The rest (c++, ci/cd, multi-word phrases) are matched by
+    one compiled alternation, longest first, inside a lookahead so a match is
+    reported at every position. Only the longest skill at a position is
+    reported; shorter skills that are prefixes of it match there too exactly
+    when the character after the prefix is a word boundary, which is fixed by
+    the longer skill's spelling, so they are precomputed.
+    """
+    unique = set(skills)
+    single_words = {s for s in unique if _WORD_RE.fullmatch(s)}
+    ordered = sorted(unique - single_words, key=len, reverse=True)
+    pattern = re.compile(r'(?=\b(' + '|'.join(map(re.escape, ordered)) + r')\b)') if ordered else None
+    implied = {
+        skill: [p for p in ordered
+                if len(p) < len(skill) and skill.startswith(p)
+                and _is_word_char(p[-1]) != _is_word_char(skill[len(p)])]
+        for skill in ordered
+    }
+
+    def find(text: str) -> set:
+        found = single_words.intersection(_WORD_RE.findall(text))
+        if pattern is not None:
+            for skill in pattern.findall(text):
+                found.add(skill)
+                found.update(implied[skill])
+        return found
+
+    return find
+
+
+def _build_ac_skill_finder(skills: List[str]):
+    """
+    Same contract as _build_skill_finder, backed by a pyahocorasick automaton:
+    one C-level pass yields every skill occurrence, then the \\b conditions
+    are checked at both ends of each hit.
+    """
+    automaton = ahocorasick.Automaton()
+    for skill in set(skills):
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+
+    def find(text: str) -> set:
+        found = set()
+        n = len(text)
+        for end, skill in automaton.iter(text):
+            if skill in found:
+                continue
+            start = end - len(skill) + 1
+            # \b holds where the word-character class changes
+            if (start > 0 and _is_word_char(text[start - 1])) == _is_word_char(skill[0]):
+                continue
+            if (end + 1 < n and _is_word_char(text[end + 1])) == _is_word_char(skill[-1]):
+                continue
+            found.add(skill)
+        return found
+
+    return find
+
+
+def make_skill_finder(skills: List[str]):
+    """Whole-word skill finder over skills, on pyahocorasick when it is installed."""
+    return (_build_ac_skill_finder if HAS_AHOCORASICK else _build_skill_finder)(skills)
+
 
 class ResumeParser:
     """Extract structured data from resume files."""
@@ -97,18 +550,63 @@ class ResumeParser:
         # Tools
         'jira', 'trello', 'asana', 'notion', 'confluence', 'slack',
     ]
+
+    # Every known skill (tech + general) with its (distinct) display form
+    KNOWN_SKILL_TITLES = {
+        skill: skill.title()
+        for skill in [s for skill_list in TECHNICAL_SKILLS.values() for s in skill_list] + GENERAL_SKILLS
+    }
+
+    # Whole-word finder over every known skill, built once at import
+    _find_known_skills = staticmethod(make_skill_finder(list(KNOWN_SKILL_TITLES)))
+    
+    # Completeness score weights: skills, education, experience, projects
+    COMPLETENESS_WEIGHTS = (0.25, 0.25, 0.25, 0.25)
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, no_cache: bool = False, stop_after_sections: bool = False,
+                 data: Optional[bytes] = None):
+        """
+        Args:
+            file_path: PDF or DOCX resume; only its name is used when data is given
+            no_cache: Always re-parse instead of reusing cached results
+            stop_after_sections: Stop reading a PDF after the first page by which
+                skills, education, experience and projects headings have all
+                appeared. Faster on long resumes, but anything on later pages
+                (durations, years, project lines) is not counted.
+            data: The file's contents, parsed in memory instead of reading file_path
+        """
         self.file_path = file_path
+        self.data = data
+        self.no_cache = no_cache
+        self.stop_after_sections = stop_after_sections
         self.text_content = ""
         self.raw_text = ""
+        self._text_lower_cache = None
+        self._sections_cache = None
+
+    @property
+    def _text_lower(self) -> str:
+        """Lower-cased text_content, computed once per text."""
+        cached = self._text_lower_cache
+        if cached is None or cached[0] is not self.text_content:
+            cached = self._text_lower_cache = (self.text_content, self.text_content.lower())
+        return cached[1]
+
+    @property
+    def _sections(self) -> Dict[str, List[str]]:
+        """Section bodies of the lower-cased text, found in one scan per text."""
+        cached = self._sections_cache
+        if cached is None or cached[0] is not self.text_content:
+            cached = self._sections_cache = (self.text_content, _find_sections(self._text_lower))
+        return cached[1]
         
     def extract_text(self) -> str:
         """Extract text from PDF or DOCX file."""
         try:
-            if self.file_path.lower().endswith('.pdf'):
+            path_lower = self.file_path.lower()
+            if path_lower.endswith('.pdf'):
                 return self._extract_from_pdf()
-            elif self.file_path.lower().endswith(('.docx', '.doc')):
+            elif path_lower.endswith(('.docx', '.doc')):
                 return self._extract_from_docx()
             else:
                 # Try both methods
@@ -120,28 +618,32 @@ class ResumeParser:
             raise Exception(f"Failed to extract text from file: {str(e)}")
     
     def _extract_from_pdf(self) -> str:
-        """Extract text from PDF."""
-        if not HAS_PYPDF2:
+        """Extract text from PDF, reusing earlier results for an unchanged file."""
+        if not (HAS_FITZ or HAS_PYPDF2):
             return ""
-        
+        if self.data is not None:
+            return _read_pdf_text(self.data, self.stop_after_sections)
+
         try:
-            text = ""
-            with open(self.file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
-        except Exception as e:
+            st = os.stat(self.file_path)
+        except OSError as e:
             print(f"Warning: Could not extract from PDF: {e}", file=sys.stderr)
             return ""
+        return _extract_pdf_cached(self.file_path, st.st_mtime_ns, st.st_size, self.stop_after_sections)
     
     def _extract_from_docx(self) -> str:
-        """Extract text from DOCX."""
+        """Extract text from DOCX, via python-docx when the XML shortcut fails."""
+        source = self.file_path if self.data is None else self.data
+        try:
+            return _read_docx_xml_text(source)
+        except Exception:
+            pass
+
         if not HAS_DOCX:
             return ""
         
         try:
-            doc = Document(self.file_path)
+            doc = Document(self.file_path if self.data is None else io.BytesIO(self.data))
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text
         except Exception as e:
@@ -150,12 +652,10 @@ class ResumeParser:
     
     def extract_skills(self) -> List[str]:
         """Extract technical skills from resume text."""
-        skills = set()
-        text_lower = self.text_content.lower()
+        text_lower = self._text_lower
         
         # Look for "Skills" section and extract nearby words
-        skills_section_pattern = r'skills?\s*:?\s*(.*?)(?:experience|education|projects|certification|$)'
-        skills_matches = re.findall(skills_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        skills_matches = self._sections['skills']
         
         if skills_matches:
             skills_text = " ".join(skills_matches)
@@ -163,56 +663,24 @@ class ResumeParser:
             skills_text = text_lower
 
         # Normalize bullet artifacts that break word boundaries (e.g., (cid:127), •)
-        skills_text = re.sub(r"\(cid:\d+\)", " ", skills_text)
+        skills_text = _CID_RE.sub(" ", skills_text)
         
-        # Search for known skills (tech + general)
-        known_skill_lists = list(self.TECHNICAL_SKILLS.values()) + [self.GENERAL_SKILLS]
-        for skill_list in known_skill_lists:
-            for skill in skill_list:
-                pattern = r'\\b' + re.escape(skill) + r'\\b'
-                if re.search(pattern, skills_text):
-                    skills.add(skill.title())
+        # Search for known skills (tech + general) in one pass; the finder's
+        # set is already deduplicated and display names are distinct
+        known = self._find_known_skills(skills_text)
+        if known:
+            return sorted(map(self.KNOWN_SKILL_TITLES.__getitem__, known))
 
         # Fallback: capture bullet/line items from the Skills section even if not in our dictionaries
-        if not skills and skills_text:
-            for line in skills_text.splitlines():
-                cleaned_line = re.sub(r"\(cid:\d+\)", " ", line)
-                cleaned_line = re.sub(r"^[^A-Za-z0-9]+", "", cleaned_line).strip()
-                if not cleaned_line:
-                    continue
-
-                # Split on common delimiters inside the line
-                for raw in re.split(r"[,;/|]", cleaned_line):
-                    candidate = raw.strip().strip('.').strip()
-                    if not candidate:
-                        continue
-
-                    words = candidate.split()
-                    lead_stop = {"and", "with", "in", "for", "of", "to", "the", "a", "an", "skilled", "proficient"}
-                    while words and (len(words[0]) <= 2 or words[0].lower() in lead_stop):
-                        words = words[1:]
-
-                    if len(words) == 0 or len(words) > 6:
-                        continue
-
-                    candidate_clean = " ".join(words)
-                    lower = candidate_clean.lower()
-                    if lower in {"skills", "skill", "experience", "internship", "projects", "education"}:
-                        continue
-
-                    normalized = re.sub(r"\s+", " ", candidate_clean).title()
-                    skills.add(normalized)
-        
-        return sorted(list(skills))
+        return sorted(_parse_skill_lines(skills_text))
     
     def extract_education(self) -> List[Dict[str, str]]:
         """Extract education information from resume."""
         education_list = []
-        text_lower = self.text_content.lower()
+        text_lower = self._text_lower
         
         # Find education section
-        education_section_pattern = r'education\s*:?\s*(.*?)(?:experience|skills|projects|certification|$)'
-        education_matches = re.findall(education_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        education_matches = self._sections['education']
         
         if education_matches:
             education_text = " ".join(education_matches)
@@ -220,8 +688,7 @@ class ResumeParser:
             education_text = text_lower
         
         # Look for degrees
-        degree_pattern = r'(bachelor|masters|phd|doctorate|diploma|certificate|b\.s|b\.a|m\.s|m\.a|m\.b\.a|mba)\s*(?:of|in)?\s*([^,\n\.]*)'
-        for match in re.finditer(degree_pattern, education_text, re.IGNORECASE):
+        for match in _DEGREE_RE.finditer(education_text):
             degree = match.group(1).title()
             field = match.group(2).strip().title() if match.group(2) else ""
             
@@ -233,29 +700,30 @@ class ResumeParser:
             })
         
         # Extract institution names (capitalized multi-word phrases)
-        institution_pattern = r'(?:university|college|school|institute)\s+(?:of\s+)?([^,\n\.]+)'
-        for match in re.finditer(institution_pattern, self.text_content, re.IGNORECASE):
+        for match in _INSTITUTION_RE.finditer(self.text_content):
             institution = match.group(1).strip()
             if len(institution) < 100:  # Sanity check
                 # Add institution to last education entry if exists
                 if education_list:
                     education_list[-1]['institution'] = institution
         
-        # Extract years (4-digit numbers that look like years)
-        year_pattern = r'\b(19|20)\d{2}\b'
-        years = re.findall(year_pattern, self.text_content)
-        if years and education_list:
-            education_list[-1]['year'] = years[-1]
+        # Attach the last year (4-digit number that looks like a year) in the
+        # education text to the last entry
+        if education_list:
+            last_year = None
+            for last_year in _YEAR_RE.finditer(education_text):
+                pass
+            if last_year:
+                education_list[-1]['year'] = last_year.group(0)
         
         return education_list
     
     def extract_experience_months(self) -> int:
         """Estimate total work experience in months."""
-        text_lower = self.text_content.lower()
+        text_lower = self._text_lower
         
         # Look for explicit experience duration mentions
-        duration_pattern = r'(\d+)\+?\s*(?:years|yrs|years?)\s*(?:of\s+)?experience'
-        matches = re.findall(duration_pattern, text_lower, re.IGNORECASE)
+        matches = _DURATION_RE.findall(text_lower)
         
         if matches:
             total_years = sum(int(match) for match in matches)
@@ -271,64 +739,59 @@ class ResumeParser:
     
     def count_projects(self) -> int:
         """Count projects mentioned in resume."""
-        text_lower = self.text_content.lower()
+        text_lower = self._text_lower
         
         # Look for projects section
-        projects_section_pattern = r'projects?\s*:?\s*(.*?)(?:experience|skills|education|$)'
-        projects_matches = re.findall(projects_section_pattern, text_lower, re.IGNORECASE | re.DOTALL)
+        projects_matches = self._sections['projects']
         
         if projects_matches:
             projects_text = " ".join(projects_matches)
         else:
             projects_text = text_lower
         
-        # Count project-like entries (bullet points, numbered items)
-        project_count = 0
-        
-        # Count lines with common project indicators
-        indicators = ['github', 'gitlab', 'project', 'built', 'developed', 'created', 'designed']
-        lines = projects_text.split('\n')
-        
-        for line in lines:
-            if any(indicator in line.lower() for indicator in indicators) and len(line) > 10:
-                project_count += 1
+        # Count project-like entries: lines mentioning a project indicator
+        # (projects_text is already lower-case)
+        project_count = sum(
+            1 for line in projects_text.split('\n')
+            if len(line) > 10 and _PROJECT_INDICATOR_RE.search(line)
+        )
         
         return max(0, project_count)
     
     def calculate_completeness_score(self, skills: List[str], education: List[Dict], 
                                      experience_months: int, projects: int) -> float:
         """Calculate resume completeness score (0-1)."""
-        score = 0.0
-        weights = {
-            'skills': 0.25,
-            'education': 0.25,
-            'experience': 0.25,
-            'projects': 0.25
-        }
-        
-        # Skills component
-        skills_score = min(len(skills) / 10, 1.0)
-        score += weights['skills'] * skills_score
-        
-        # Education component
-        education_score = 1.0 if len(education) > 0 else 0.0
-        score += weights['education'] * education_score
-        
-        # Experience component
-        experience_score = min(experience_months / 120, 1.0)  # 10 years = full score
-        score += weights['experience'] * experience_score
-        
-        # Projects component
-        projects_score = min(projects / 5, 1.0)  # 5 projects = full score
-        score += weights['projects'] * projects_score
+        components = (
+            min(len(skills) / 10, 1.0),
+            1.0 if len(education) > 0 else 0.0,
+            min(experience_months / 120, 1.0),  # 10 years = full score
+            min(projects / 5, 1.0),  # 5 projects = full score
+        )
+        score = sum(w * c for w, c in zip(self.COMPLETENESS_WEIGHTS, components))
         
         return round(score, 2)
     
-    def parse(self) -> Dict[str, Any]:
-        """Parse resume and extract all information."""
+    def parse(self, text: Optional[str] = None) -> Dict[str, Any]:
+        """Parse resume and extract all information.
+
+        If ``text`` is given it is used as the resume content and the file is not read.
+        Results for files are cached by content hash unless ``no_cache`` was set
+        or CACHE_MAX_ENTRIES is 0.
+        """
+        fingerprint = None
+        if text is None and not self.no_cache and CACHE_MAX_ENTRIES > 0:
+            fingerprint = _file_fingerprint(self.file_path) if self.data is None else _fingerprint(self.data)
+            if fingerprint and self.stop_after_sections:
+                fingerprint += "-partial"
+            if fingerprint:
+                try:
+                    return json_loads(_read_cached_result(fingerprint))
+                except (OSError, ValueError):
+                    pass
+
         try:
             # Extract text
-            self.raw_text = self.extract_text()
+            self.raw_text = self.extract_text() if text is None else text
             if not self.raw_text:
                 raise ValueError("Could not extract text from resume file")
             
@@ -342,7 +805,7 @@ class ResumeParser:
             projects = self.count_projects()
             completeness = self.calculate_completeness_score(skills, education, experience_months, projects)
             
-            return {
+            result = {
                 'skills': skills,
                 'education': education,
                 'experience_months': experience_months,
@@ -352,47 +815,81 @@ class ResumeParser:
         except Exception as e:
             raise Exception(f"Resume parsing failed: {str(e)}")
 
+        if fingerprint:
+            _write_cached_result(fingerprint, result)
+        return result
+
+
+def parse_resume(file_path: str) -> Dict[str, Any]:
+    """Parse a PDF or DOCX resume file."""
+    return ResumeParser(file_path).parse()
+
+
+def parse_resume_bytes(data: bytes, filename: str) -> Dict[str, Any]:
+    """
+    Parse an uploaded PDF or DOCX held in memory; filename picks the format.
+
+    Uploads are never written to the parse cache.
+    """
+    return ResumeParser(filename, data=data, no_cache=True).parse()
+
+
+def parse_resume_text(text: str) -> Dict[str, Any]:
+    """Parse resume content that is already in memory, without a temp file."""
+    return ResumeParser("").parse(text)
+
+
+def _error_result(message: str) -> Dict[str, Any]:
+    """Empty parse result carrying an error message, as printed by the CLI."""
+    return {
+        'error': message,
+        'skills': [],
+        'education': [],
+        'experience_months': 0,
+        'projects_count': 0,
+        'resume_completeness_score': 0
+    }
+
+
+def serve() -> int:
+    """Persistent worker: parse one newline-delimited path per input line."""
+    for line in sys.stdin:
+        file_path = line.strip()
+        if not file_path:
+            continue
+        if not os.path.exists(file_path):
+            result = _error_result(f'File not found: {file_path}')
+        else:
+            try:
+                result = ResumeParser(file_path).parse()
+            except Exception as e:
+                result = _error_result(str(e))
+        _print_json(result)
+    return 0
+
 
 def main():
     """Main entry point for resume parser."""
+    if "--serve" in sys.argv[1:]:
+        sys.exit(serve())
+
     if len(sys.argv) != 2:
-        print(json.dumps({
-            'error': 'Usage: resume_parser.py <file_path>',
-            'skills': [],
-            'education': [],
-            'experience_months': 0,
-            'projects_count': 0,
-            'resume_completeness_score': 0
-        }))
+        _print_json(_error_result('Usage: resume_parser.py <file_path>'))
         sys.exit(1)
     
     file_path = sys.argv[1]
     
     # Validate file exists
     if not os.path.exists(file_path):
-        print(json.dumps({
-            'error': f'File not found: {file_path}',
-            'skills': [],
-            'education': [],
-            'experience_months': 0,
-            'projects_count': 0,
-            'resume_completeness_score': 0
-        }))
+        _print_json(_error_result(f'File not found: {file_path}'))
         sys.exit(1)
     
     try:
         parser = ResumeParser(file_path)
         result = parser.parse()
-        print(json.dumps(result))
+        _print_json(result)
     except Exception as e:
-        print(json.dumps({
-            'error': str(e),
-            'skills': [],
-            'education': [],
-            'experience_months': 0,
-            'projects_count': 0,
-            'resume_completeness_score': 0
-        }))
+        _print_json(_error_result(str(e)))
         sys.exit(1)
 
 
@@ -5,17 +5,49 @@ This shows how to integrate the resume parser into a web service.
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
-import tempfile
-from pathlib import Path
+import asyncio
 import os
 import sys
 
 # Add parent directory to path to import resume_parser
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from resume_parser import parse_resume
+from resume_parser import HAS_ORJSON, parse_resume_bytes
 
-app = FastAPI(title="Resume Parser API")
+
+if HAS_ORJSON:
+    import orjson
+
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson (same options as FastAPI's ORJSONResponse)."""
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+else:
+    FastJSONResponse = JSONResponse
+
+app = FastAPI(title="Resume Parser API", default_response_class=FastJSONResponse)
+
+
+def _parse_upload(data: bytes, filename: str) -> dict:
+    """Parse uploaded resume bytes in memory; blocking, so run it in a worker thread."""
+    result = parse_resume_bytes(data, filename)
+    result['filename'] = filename
+    return result
+
+
+async def _parse_uploads(files: list[UploadFile]) -> list:
+    """
+    Parse uploads concurrently in the default thread pool.
+    
+    Returns one entry per file, in order: the parsed result, or the
+    exception raised while parsing it.
+    """
+    async def _one(file: UploadFile):
+        data = await file.read()
+        return await asyncio.to_thread(_parse_upload, data, file.filename)
+    
+    return await asyncio.gather(*(_one(file) for file in files), return_exceptions=True)
 
 
 @app.post("/api/parse-resume")
@@ -38,29 +70,9 @@ async def parse_resume_endpoint(file: UploadFile = File(...)):
         )
     
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
-        
-        # Parse resume
-        result = parse_resume(tmp_path)
-        
-        # Clean up
-        os.unlink(tmp_path)
-        
-        # Add file metadata
-        result['filename'] = file.filename
-        
-        return JSONResponse(content=result)
+        return await asyncio.to_thread(_parse_upload, await file.read(), file.filename)
     
     except Exception as e:
-        # Clean up temp file if it exists
-        try:
-            os.unlink(tmp_path)
-        except:
-            pass
-        
         raise HTTPException(
             status_code=500,
             detail=f"Error parsing resume: {str(e)}"
@@ -78,30 +90,12 @@ async def parse_resume_batch(files: list[UploadFile] = File(...)):
         curl -X POST -F "files=@resume1.pdf" -F "files=@resume2.docx" http://localhost:8000/api/parse-resume-batch
     """
     
-    results = []
-    
-    for file in files:
-        try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-                tmp.write(await file.read())
-                tmp_path = tmp.name
-            
-            # Parse resume
-            result = parse_resume(tmp_path)
-            result['filename'] = file.filename
-            results.append(result)
-            
-            # Clean up
-            os.unlink(tmp_path)
-        
-        except Exception as e:
-            results.append({
-                'filename': file.filename,
-                'error': str(e)
-            })
+    results = [
+        {'filename': file.filename, 'error': str(outcome)} if isinstance(outcome, Exception) else outcome
+        for file, outcome in zip(files, await _parse_uploads(files))
+    ]
     
-    return JSONResponse(content=results)
+    return results
 
 
 @app.post("/api/analyze-candidates")
@@ -112,21 +106,7 @@ async def analyze_candidates(files: list[UploadFile] = File(...)):
     Returns: Ranked list of candidates
     """
     
-    results = []
-    
-    for file in files:
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-                tmp.write(await file.read())
-                tmp_path = tmp.name
-            
-            result = parse_resume(tmp_path)
-            result['filename'] = file.filename
-            results.append(result)
-            
-            os.unlink(tmp_path)
-        except:
-            pass
+    results = [outcome for outcome in await _parse_uploads(files) if not isinstance(outcome, Exception)]
     
     # Sort by completeness score (descending)
     results.sort(key=lambda x: x.get('resume_completeness_score', 0), reverse=True)
@@ -135,7 +115,7 @@ async def analyze_candidates(files: list[UploadFile] = File(...)):
     for i, result in enumerate(results, 1):
         result['rank'] = i
     
-    return JSONResponse(content=results)
+    return results
 
 
 @app.post("/api/filter-candidates")
@@ -161,32 +141,23 @@ async def filter_candidates(
     
     qualified = []
     
-    for file in files:
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-                tmp.write(await file.read())
-                tmp_path = tmp.name
-            
-            result = parse_resume(tmp_path)
-            result['filename'] = file.filename
-            
-            # Check criteria
-            skills_match = all(
-                any(req_skill.lower() in skill.lower() for skill in result['skills'])
-                for req_skill in required_skills
-            ) if required_skills else True
-            
-            exp_match = result['experience_months'] >= min_experience_months
-            complete_match = result['resume_completeness_score'] >= min_completeness
-            
-            if skills_match and exp_match and complete_match:
-                qualified.append(result)
-            
-            os.unlink(tmp_path)
-        except:
-            pass
-    
-    return JSONResponse(content={
+    for result in await _parse_uploads(files):
+        if isinstance(result, Exception):
+            continue
+        
+        # Check criteria
+        skills_match = all(
+            any(req_skill.lower() in skill.lower() for skill in result['skills'])
+            for req_skill in required_skills
+        ) if required_skills else True
+        
+        exp_match = result['experience_months'] >= min_experience_months
+        complete_match = result['resume_completeness_score'] >= min_completeness
+        
+        if skills_match and exp_match and complete_match:
+            qualified.append(result)
+    
+    return {
         'total_files': len(files),
         'qualified_count': len(qualified),
         'criteria': {
@@ -195,7 +166,7 @@ async def filter_candidates(
             'min_completeness': min_completeness
         },
         'qualified_candidates': qualified
-    })
+    }
 
 
 @app.get("/health")
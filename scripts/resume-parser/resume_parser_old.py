@@ -3,14 +3,20 @@ Resume Parser: Extract structured data from PDF and DOCX resume files.
 Returns JSON with skills, education, experience, projects, and completeness score.
 """
 
+import io
 import json
 import re
 import os
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from resume_parser import make_skill_finder
 
 # Try to import PDF libraries
 try:
@@ -20,6 +26,12 @@ except ImportError:
     PDF_AVAILABLE = False
     print("Warning: pdfplumber not installed. PDF parsing disabled.", file=sys.stderr)
 
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 # Try to import DOCX library
 try:
     from docx import Document
@@ -29,9 +41,67 @@ except ImportError:
     print("Warning: python-docx not installed. DOCX parsing disabled.", file=sys.stderr)
 
 
+# Patterns used on every resume, compiled once at import
+_SKILL_PHRASE_RES = (
+    re.compile(r'\b(?:proficient|experienced|skilled|expertise)\s+(?:in|with)?\s+([a-zA-Z\s&,\.]+?)(?:,|and|\.|;|\n)',
+               re.IGNORECASE | re.MULTILINE),
+    re.compile(r'\b(?:technical\s+)?skills?:?\s*\n?([a-zA-Z\s&,\.]+?)(?:\n|•)', re.IGNORECASE | re.MULTILINE),
+)
+# Skill list delimiters, all folded onto ',' so one str.split separates items
+_SKILL_ITEM_DELIMS = str.maketrans('&•', ',,')
+_NON_WORD_RE = re.compile(r'[\s\W]')
+
+# All date-range formats in one pass; match.lastgroup names the format matched
+_DATE_RANGE_RE = re.compile(
+    r'(?P<monyear>(?P<start_month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?P<start_year>\d{4})\s*[-–]\s*'
+    r'(?P<end_part>present|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?P<end_year>\d{4})?)'
+    r'|(?P<numeric>\d{1,2}/\d{1,2}/\d{4}\s*[-–]\s*(?:present|\d{1,2}/\d{1,2}/\d{4}))'
+    r'|(?P<years>\d{4}\s*[-–]\s*(?:present|\d{4}))',
+    re.IGNORECASE
+)
+
+_PROJECTS_SECTION_RE = re.compile(r'(?:projects?|portfolio|portfolio\s+projects?)\s*:?\s*\n', re.IGNORECASE)
+_BULLET_ITEM_RE = re.compile(r'(?:^|\n)\s*[-•*]\s+')
+_NUMBERED_ITEM_RE = re.compile(r'(?:^|\n)\s*\d+\.\s+')
+_PROJECT_VERB_RES = tuple(
+    re.compile(rf'\b{keyword}\b', re.IGNORECASE)
+    for keyword in ('built', 'developed', 'created', 'designed', 'implemented')
+)
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b(?:\+?1)?[\s.-]?\(?[2-9]\d{2}\)?[\s.-]?[2-9]\d{2}[\s.-]?\d{4}\b')
+_SECTION_WORD_RES = tuple(
+    re.compile(rf'\b{section}\b', re.IGNORECASE)
+    for section in ('experience', 'education', 'skills', 'projects', 'portfolio')
+)
+
+_INSTITUTION_RES = (
+    re.compile(r'(?:at|from)?\s+([A-Z][a-zA-Z\s&\-\.]+(?:University|College|Institute|School|Academy))'),
+    re.compile(r'([A-Z][a-zA-Z\s&\-\.]+(?:University|College|Institute|School|Academy))'),
+)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_FOUR_DIGIT_YEAR_RE = re.compile(r'(19|20)\d{2}')
+_TWO_DIGIT_YEAR_RE = re.compile(r'\b(\d{2})\b')
+
+
+def _count_matches(pattern: "re.Pattern", text: str, limit: int) -> int:
+    """Number of non-overlapping matches of pattern in text, counting at most limit."""
+    return sum(1 for _ in islice(pattern.finditer(text), limit))
+
+
+@lru_cache(maxsize=4096)
+def _keyword_re(keyword: str) -> "re.Pattern":
+    """Compiled case-insensitive whole-word pattern for a keyword."""
+    return re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE)
+
+
 class ResumeParser:
     """Parse resume files and extract structured data."""
 
+    # Batch parsing creates many short-lived parsers; slots keep them small
+    __slots__ = ('file_path', 'text', 'lines', '_skills', '_education',
+                 '_experience_months', '_text_lower_cache')
+
     # Comprehensive keyword lists for skill extraction
     PROGRAMMING_LANGUAGES = [
         'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'c',
@@ -65,6 +135,26 @@ class ResumeParser:
         'kafka', 'airflow', 'dbt', 'looker', 'tableau', 'power bi'
     ]
 
+    # Whole-word scanner over all the keyword lists above, built once at import
+    _scan_skill_keywords = staticmethod(make_skill_finder(
+        PROGRAMMING_LANGUAGES + WEB_FRAMEWORKS + DATABASES + TOOLS_PLATFORMS + DATA_SCIENCE
+    ))
+
+    # Fewer characters than this from pypdfium2 means pdfplumber should try
+    MIN_FAST_PDF_CHARS = 200
+
+    # Upper bound on the projects count
+    MAX_PROJECTS = 20
+
+    # Resumes are rarely longer; pages past this are not read
+    MAX_PDF_PAGES = 20
+
+    # Month abbreviation -> month number for date ranges
+    _MONTH_MAP = {
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+    }
+
     # Degree keywords
     DEGREE_KEYWORDS = {
         'bachelor': ['bachelor', 'b.s.', 'b.a.', 'bs', 'ba', 'undergraduate'],
@@ -74,6 +164,12 @@ class ResumeParser:
         'bootcamp': ['bootcamp', 'certification', 'certificate']
     }
 
+    # Substring test for "any keyword of this degree type", one pattern per type
+    _DEGREE_TYPE_RES = {
+        degree_type: re.compile('|'.join(re.escape(kw.lower()) for kw in keywords))
+        for degree_type, keywords in DEGREE_KEYWORDS.items()
+    }
+
     # Common education institutions for better extraction
     INSTITUTION_KEYWORDS = [
         'university', 'college', 'institute', 'school', 'academy',
@@ -88,7 +184,7 @@ class ResumeParser:
     ]
 
     # Generic words to filter out from skills (not actual skills)
-    SKILL_BLOCKLIST = [
+    SKILL_BLOCKLIST = frozenset([
         'technical', 'knowledge', 'skills', 'skill', 'proficient', 'experience',
         'experienced', 'expertise', 'proficiency', 'ability', 'abilities',
         'strong', 'excellent', 'good', 'great', 'advanced', 'intermediate',
@@ -109,7 +205,7 @@ class ResumeParser:
         'communication', 'collaboration', 'leadership', 'management', 'time',
         'learning', 'quick', 'fast', 'efficient', 'effective', 'responsible',
         'responsibility', 'responsibilities', 'duties', 'duty', 'role', 'roles'
-    ]
+    ])
 
     # Words that indicate something is NOT an institution (false positives)
     INSTITUTION_BLOCKLIST = [
@@ -128,100 +224,188 @@ class ResumeParser:
         self.file_path = Path(file_path)
         self.text = ""
         self.lines = []
+        self._reset_extractions()
+
+    @classmethod
+    def from_text(cls, text: str) -> "ResumeParser":
+        """Create a parser over resume text already in memory (no file is read)."""
+        parser = cls.__new__(cls)
+        parser.file_path = None
+        parser.text = text
+        parser.lines = [s for s in (line.strip() for line in text.splitlines()) if s]
+        parser._reset_extractions()
+        return parser
+
+    @classmethod
+    def parse_many(cls, texts: List[str]) -> List[Dict]:
+        """
+        Parse a batch of resume texts, returning one result per input text.
+
+        Identical texts are parsed once and share a result. Every parser uses
+        the same class-level compiled skill scanner, so nothing is rebuilt per
+        resume. Parsing holds the GIL, so unique texts are parsed one after
+        another; use parse_resumes to spread files over processes.
+        """
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            positions.setdefault(text, []).append(i)
+
+        unique = list(positions)
+        parsed = [cls.from_text(t).parse() for t in unique]
+
+        results: List[Dict] = [None] * len(texts)
+        for text, result in zip(unique, parsed):
+            for i in positions[text]:
+                results[i] = result
+        return results
+
+    def _reset_extractions(self):
+        """Forget cached extraction results (the text has changed)."""
+        self._skills = None
+        self._education = None
+        self._experience_months = None
+        self._text_lower_cache = None
+
+    @property
+    def skills(self) -> List[str]:
+        """Technical skills, extracted once per text."""
+        return self.extract_skills()
+
+    @property
+    def education(self) -> List[Dict[str, Optional[str]]]:
+        """Education entries, extracted once per text."""
+        return self.extract_education()
+
+    @property
+    def experience_months(self) -> int:
+        """Total months of experience, computed once per text."""
+        return self.extract_experience_months()
+
+    @property
+    def _text_lower(self) -> str:
+        """Lower-cased resume text, computed once per extracted text."""
+        cached = self._text_lower_cache
+        if cached is None or cached[0] is not self.text:
+            cached = self._text_lower_cache = (self.text, self.text.lower())
+        return cached[1]
 
     def extract_text(self) -> str:
         """Extract text from PDF or DOCX file."""
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
+        if self.file_path is None:
+            # Created with from_text: the text is already loaded
+            return self.text
+
+        # Read the file once; the PDF/DOCX libraries parse from memory
+        try:
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from None
 
         if self.file_path.suffix.lower() == '.pdf':
-            if not PDF_AVAILABLE:
+            if not (PDF_AVAILABLE or PDFIUM_AVAILABLE):
                 raise ImportError("pdfplumber is required for PDF parsing. Install with: pip install pdfplumber")
-            self.text = self._extract_pdf()
+            self.text = self._extract_pdf(data)
         elif self.file_path.suffix.lower() == '.docx':
             if not DOCX_AVAILABLE:
                 raise ImportError("python-docx is required for DOCX parsing. Install with: pip install python-docx")
-            self.text = self._extract_docx()
+            self.text = self._extract_docx(data)
         else:
             raise ValueError(f"Unsupported file type: {self.file_path.suffix}")
 
         # Split into lines for easier processing
-        self.lines = [line.strip() for line in self.text.split('\n') if line.strip()]
+        self.lines = [s for s in (line.strip() for line in self.text.split('\n')) if s]
+        self._reset_extractions()
         return self.text
 
-    def _extract_pdf(self) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        with pdfplumber.open(self.file_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-                text += "\n"
-        return text
-
-    def _extract_docx(self) -> str:
-        """Extract text from DOCX file."""
-        doc = Document(self.file_path)
-        text = ""
+    def _extract_pdf(self, data: bytes) -> str:
+        """
+        Extract text from PDF file contents (first MAX_PDF_PAGES pages).
+
+        pypdfium2 extracts plain text much faster than pdfplumber's layout
+        analysis; pdfplumber is only used when it is missing or returns too
+        little text (scanned or unusually laid out PDFs).
+        """
+        if PDFIUM_AVAILABLE:
+            text = self._extract_pdf_fast(data)
+            if len(text.strip()) >= self.MIN_FAST_PDF_CHARS or not PDF_AVAILABLE:
+                return text
+        return self._extract_pdf_slow(data)
+
+    def _extract_pdf_fast(self, data: bytes) -> str:
+        """Extract text from PDF file contents with pypdfium2."""
+        pdf = pdfium.PdfDocument(data)
+        try:
+            parts = []
+            for index in range(min(len(pdf), self.MAX_PDF_PAGES)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                parts.append("\n")
+                textpage.close()
+                page.close()
+            return "".join(parts)
+        finally:
+            pdf.close()
+
+    def _extract_pdf_slow(self, data: bytes) -> str:
+        """Extract text from PDF file contents with pdfplumber."""
+        parts = []
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
+            for page in pdf.pages[:self.MAX_PDF_PAGES]:
+                parts.append(page.extract_text() or "")
+                parts.append("\n")
+                # Drop the page's cached layout objects once its text is out
+                page.flush_cache()
+        return "".join(parts)
+
+    def _extract_docx(self, data: bytes) -> str:
+        """Extract text from DOCX file contents."""
+        doc = Document(io.BytesIO(data))
+        parts = []
+        append = parts.append
         for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+            append(paragraph.text)
+            append("\n")
         # Also extract from tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
-                    text += cell.text + " "
-                text += "\n"
-        return text
+                    append(cell.text)
+                    append(" ")
+                append("\n")
+        return "".join(parts)
 
     def extract_skills(self) -> List[str]:
-        """Extract technical skills from resume text."""
+        """Extract technical skills from resume text (cached until the text changes)."""
+        if self._skills is None:
+            self._skills = self._extract_skills()
+        return self._skills
+
+    def _extract_skills(self) -> List[str]:
+        """Uncached work behind extract_skills."""
         if not self.text:
             self.extract_text()
 
         skills_found = set()
-        text_lower = self.text.lower()
-
-        # Extract programming languages
-        for lang in self.PROGRAMMING_LANGUAGES:
-            if self._keyword_in_text(lang, text_lower):
-                skills_found.add(lang.title())
-
-        # Extract web frameworks
-        for framework in self.WEB_FRAMEWORKS:
-            if self._keyword_in_text(framework, text_lower):
-                skills_found.add(framework.title())
+        text_lower = self._text_lower
 
-        # Extract databases
-        for db in self.DATABASES:
-            if self._keyword_in_text(db, text_lower):
-                skills_found.add(db.title())
-
-        # Extract tools and platforms
-        for tool in self.TOOLS_PLATFORMS:
-            if self._keyword_in_text(tool, text_lower):
-                skills_found.add(tool.title())
-
-        # Extract data science tools
-        for tool in self.DATA_SCIENCE:
-            if self._keyword_in_text(tool, text_lower):
-                skills_found.add(tool.title())
+        # Extract languages, frameworks, databases, tools and data science
+        # keywords with the shared whole-word skill finder
+        for keyword in self._scan_skill_keywords(text_lower):
+            skills_found.add(keyword.title())
 
         # Extract generic skill patterns (noun + skill-related words)
-        skill_patterns = [
-            r'\b(?:proficient|experienced|skilled|expertise)\s+(?:in|with)?\s+([a-zA-Z\s&,\.]+?)(?:,|and|\.|;|\n)',
-            r'\b(?:technical\s+)?skills?:?\s*\n?([a-zA-Z\s&,\.]+?)(?:\n|•)',
-        ]
-
-        for pattern in skill_patterns:
-            matches = re.finditer(pattern, self.text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+        for pattern in _SKILL_PHRASE_RES:
+            for match in pattern.finditer(self.text):
                 skills_text = match.group(1)
-                skill_items = [s.strip() for s in re.split(r'[,&•]', skills_text)]
+                skill_items = [s.strip() for s in skills_text.translate(_SKILL_ITEM_DELIMS).split(',')]
                 for skill in skill_items:
                     if len(skill) > 2 and len(skill) < 50:
                         skills_found.add(skill.strip())
 
         # Filter out generic/non-skill words
-        filtered_skills = []
+        filtered_skills = set()
         for skill in skills_found:
             skill_lower = skill.lower().strip()
             # Skip if it's in the blocklist
@@ -234,83 +418,98 @@ class ResumeParser:
             if skill_lower.isdigit():
                 continue
             # Skip if it's mostly whitespace or punctuation
-            if len(re.sub(r'[\s\W]', '', skill_lower)) < 2:
+            if len(_NON_WORD_RE.sub('', skill_lower)) < 2:
                 continue
-            filtered_skills.append(skill)
+            filtered_skills.add(skill)
 
-        return sorted(list(set(filtered_skills)))
+        return sorted(filtered_skills)
 
     def extract_education(self) -> List[Dict[str, Optional[str]]]:
-        """Extract education information from resume."""
+        """Extract education information from resume (cached until the text changes)."""
+        if self._education is None:
+            self._education = self._extract_education()
+        return self._education
+
+    def _extract_education(self) -> List[Dict[str, Optional[str]]]:
+        """Uncached work behind extract_education."""
         if not self.text:
             self.extract_text()
 
         education_list = []
-        text_lower = self.text.lower()
+        seen = set()
+        lines_lower = [line.lower() for line in self.lines]
+        # (institution, year) per line index; a line often matches several keywords
+        line_details: Dict[int, Tuple[Optional[str], Optional[int]]] = {}
 
         # Find degree types
         for degree_type, keywords in self.DEGREE_KEYWORDS.items():
+            # One alternation search per line finds the lines worth checking
+            candidates = [i for i, line_lower in enumerate(lines_lower)
+                          if self._DEGREE_TYPE_RES[degree_type].search(line_lower)]
+            if not candidates:
+                continue
+
             for keyword in keywords:
+                keyword_lower = keyword.lower()
                 # Find lines containing degree keyword
-                for i, line in enumerate(self.lines):
-                    if keyword.lower() in line.lower():
-                        degree_info = {
-                            'degree': degree_type.title(),
-                            'institution': None,
-                            'year': None
-                        }
+                for i in candidates:
+                    if keyword_lower not in lines_lower[i]:
+                        continue
 
+                    details = line_details.get(i)
+                    if details is None:
                         # Look for institution in this line and nearby lines
                         context = ' '.join(self.lines[max(0, i-2):min(len(self.lines), i+3)])
-                        institution = self._extract_institution(context)
-                        if institution:
-                            degree_info['institution'] = institution
-
                         # Extract year and normalize to 4-digit format
-                        year = self._extract_year(line)
-                        degree_info['year'] = self._normalize_year(year)
-
-                        # Avoid duplicates
-                        if degree_info not in education_list:
-                            education_list.append(degree_info)
+                        year = self._normalize_year(self._extract_year(self.lines[i]))
+                        details = line_details[i] = (self._extract_institution(context) or None, year)
+
+                    # Avoid duplicates
+                    key = (degree_type, details)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    education_list.append({
+                        'degree': degree_type.title(),
+                        'institution': details[0],
+                        'year': details[1]
+                    })
 
         # Clean up education entries
         cleaned_education = self._clean_education_entries(education_list)
         return cleaned_education
 
     def extract_experience_months(self) -> int:
-        """Calculate total months of experience from resume."""
+        """Calculate total months of experience from resume (cached until the text changes)."""
+        if self._experience_months is None:
+            self._experience_months = self._extract_experience_months()
+        return self._experience_months
+
+    def _extract_experience_months(self) -> int:
+        """Uncached work behind extract_experience_months."""
         if not self.text:
             self.extract_text()
 
         total_months = 0
         experience_entries = []
 
-        # Pattern to find date ranges (e.g., "Jan 2020 - Dec 2021")
-        date_patterns = [
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})\s*[-–]\s*(present|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})?',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})\s*[-–]\s*(present|\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{4})\s*[-–]\s*(present|\d{4})',
-        ]
-
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, self.text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    start_month, start_year, end_part, end_year = self._parse_date_range(match)
-                    
-                    # Calculate months
-                    if end_year:
-                        months = (int(end_year) - int(start_year)) * 12
-                        months += end_month - start_month
-                        experience_entries.append(months)
-                    elif 'present' in end_part.lower():
-                        # Assume work until now
-                        current_year = datetime.now().year
-                        months = (current_year - int(start_year)) * 12
-                        experience_entries.append(months)
-                except (ValueError, IndexError):
-                    continue
+        # Date ranges (e.g., "Jan 2020 - Dec 2021"), all formats in one scan
+        for match in _DATE_RANGE_RE.finditer(self.text):
+            try:
+                start_month, start_year, end_month, end_part, end_year = self._parse_date_range(match)
+                
+                # Calculate months
+                if end_year:
+                    months = (int(end_year) - int(start_year)) * 12
+                    months += end_month - start_month
+                    experience_entries.append(months)
+                elif 'present' in end_part.lower():
+                    # Assume work until now
+                    current_year = datetime.now().year
+                    months = (current_year - int(start_year)) * 12
+                    experience_entries.append(months)
+            except (ValueError, IndexError):
+                continue
 
         # Sum up all experiences (removing outliers and duplicates)
         if experience_entries:
@@ -327,34 +526,32 @@ class ResumeParser:
 
         projects_count = 0
 
-        # Look for "Projects" or "Portfolio" sections
-        section_pattern = r'(?:projects?|portfolio|portfolio\s+projects?)\s*:?\s*\n'
-        sections = re.split(section_pattern, self.text, flags=re.IGNORECASE)
+        # Look for "Projects" or "Portfolio" sections; the first one runs up
+        # to the next such header
+        header = _PROJECTS_SECTION_RE.search(self.text)
 
-        if len(sections) > 1:
-            projects_section = sections[1]
+        if header:
+            next_header = _PROJECTS_SECTION_RE.search(self.text, header.end())
+            projects_section = self.text[header.end():next_header.start() if next_header else None]
 
             # Count bullet points or numbered items
-            bullet_pattern = r'(?:^|\n)\s*[-•*]\s+'
-            bullets = re.findall(bullet_pattern, projects_section)
-            projects_count += len(bullets)
+            projects_count += _count_matches(_BULLET_ITEM_RE, projects_section, self.MAX_PROJECTS)
 
             # Count numbered items
-            numbered_pattern = r'(?:^|\n)\s*\d+\.\s+'
-            numbered = re.findall(numbered_pattern, projects_section)
-            projects_count += len(numbered)
+            projects_count += _count_matches(_NUMBERED_ITEM_RE, projects_section, self.MAX_PROJECTS)
+
+            # Keywords below only add to the count, which is capped anyway
+            if projects_count >= self.MAX_PROJECTS:
+                return self.MAX_PROJECTS
 
         # Also look for project-related keywords
-        project_keywords = ['built', 'developed', 'created', 'designed', 'implemented']
-        for keyword in project_keywords:
+        for pattern in _PROJECT_VERB_RES:
             # Count occurrences in experience section
-            pattern = rf'\b{keyword}\b'
-            matches = re.findall(pattern, self.text, re.IGNORECASE)
             # Only count if it's in a work context (near job titles)
-            if len(matches) > 0:
-                projects_count += min(len(matches) // 2, 1)  # Avoid over-counting
+            if _count_matches(pattern, self.text, 2) == 2:
+                projects_count += 1  # Avoid over-counting
 
-        return min(projects_count, 20)  # Cap at 20 to avoid unrealistic numbers
+        return min(projects_count, self.MAX_PROJECTS)  # Cap to avoid unrealistic numbers
 
     def calculate_completeness_score(self) -> float:
         """Calculate resume completeness score (0-1)."""
@@ -365,20 +562,19 @@ class ResumeParser:
         max_score = 10.0
 
         # Check for contact information
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', self.text):
+        if _EMAIL_RE.search(self.text) is not None:
             score += 1.5  # Email found
 
-        if re.search(r'\b(?:\+?1)?[\s.-]?\(?[2-9]\d{2}\)?[\s.-]?[2-9]\d{2}[\s.-]?\d{4}\b', self.text):
+        if _PHONE_RE.search(self.text) is not None:
             score += 0.5  # Phone number found
 
         # Check for sections
-        sections = ['experience', 'education', 'skills', 'projects', 'portfolio']
         sections_found = 0
-        for section in sections:
-            if re.search(rf'\b{section}\b', self.text, re.IGNORECASE):
+        for pattern in _SECTION_WORD_RES:
+            if pattern.search(self.text):
                 sections_found += 1
 
-        score += (sections_found / len(sections)) * 3  # Up to 3 points for sections
+        score += (sections_found / len(_SECTION_WORD_RES)) * 3  # Up to 3 points for sections
 
         # Check for education
         if self.extract_education():
@@ -409,19 +605,13 @@ class ResumeParser:
 
     def _keyword_in_text(self, keyword: str, text: str) -> bool:
         """Check if keyword appears in text as whole word."""
-        pattern = rf'\b{re.escape(keyword)}\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        return bool(_keyword_re(keyword).search(text))
 
     def _extract_institution(self, text: str) -> Optional[str]:
         """Extract institution name from text."""
         # Look for university/college names
-        patterns = [
-            r'(?:at|from)?\s+([A-Z][a-zA-Z\s&\-\.]+(?:University|College|Institute|School|Academy))',
-            r'([A-Z][a-zA-Z\s&\-\.]+(?:University|College|Institute|School|Academy))',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _INSTITUTION_RES:
+            match = pattern.search(text)
             if match:
                 institution = match.group(1).strip()
                 if len(institution) > 3 and len(institution) < 100:
@@ -431,8 +621,7 @@ class ResumeParser:
 
     def _extract_year(self, text: str) -> Optional[str]:
         """Extract graduation year from text."""
-        year_pattern = r'\b(19|20)\d{2}\b'
-        matches = re.findall(year_pattern, text)
+        matches = _YEAR_RE.findall(text)
         if matches:
             # Return the last year found (likely graduation year)
             return matches[-1]
@@ -446,11 +635,11 @@ class ResumeParser:
         # If it's already a 4-digit string matching 19xx or 20xx
         if isinstance(year, str):
             # Try to find a 4-digit year
-            match = re.search(r'(19|20)\d{2}', year)
+            match = _FOUR_DIGIT_YEAR_RE.search(year)
             if match:
                 return int(match.group(0))
             # Try 2-digit year (assume 20xx for < 50, 19xx for >= 50)
-            match = re.search(r'\b(\d{2})\b', year)
+            match = _TWO_DIGIT_YEAR_RE.search(year)
             if match:
                 two_digit = int(match.group(1))
                 if two_digit < 50:
@@ -479,12 +668,7 @@ class ResumeParser:
             
             # Skip if institution looks like a non-institution (event, competition, etc.)
             inst_lower = institution.lower()
-            is_blocklisted = False
-            for blocked in self.INSTITUTION_BLOCKLIST:
-                if blocked in inst_lower:
-                    is_blocklisted = True
-                    break
-            if is_blocklisted:
+            if any(blocked in inst_lower for blocked in self.INSTITUTION_BLOCKLIST):
                 continue
             
             # Skip if institution is too long (likely a sentence, not an institution name)
@@ -492,12 +676,8 @@ class ResumeParser:
                 continue
             
             # Skip if institution doesn't contain any institution keyword
-            has_institution_keyword = False
-            for keyword in self.INSTITUTION_KEYWORDS:
-                if keyword.lower() in inst_lower:
-                    has_institution_keyword = True
-                    break
-            if not has_institution_keyword:
+            # (the keywords are already lower-case)
+            if not any(keyword in inst_lower for keyword in self.INSTITUTION_KEYWORDS):
                 continue
             
             # Create deduplication key (degree + institution, case-insensitive)
@@ -515,39 +695,21 @@ class ResumeParser:
         
         return cleaned
 
-    def _parse_date_range(self, match) -> Tuple[int, int, str, Optional[int]]:
-        """Parse date range from regex match."""
-        groups = match.groups()
-
+    def _parse_date_range(self, match) -> Tuple[int, int, int, str, Optional[int]]:
+        """Parse date range from a _DATE_RANGE_RE match."""
         # Handle different date formats
-        if len(groups) >= 4:
-            start_part = groups[0]
-            start_year = int(groups[1])
-            end_part = groups[2]
-            end_year = int(groups[3]) if groups[3] else None
-
-            # Convert month string to number
-            months = {
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-            }
-
-            start_month = 1
-            end_month = 12
+        if match.lastgroup == 'monyear':
+            start_year = int(match.group('start_year'))
+            end_part = match.group('end_part')
+            end_year = int(match.group('end_year')) if match.group('end_year') else None
 
-            if isinstance(start_part, str):
-                month_match = re.match(r'([a-z]+)', start_part, re.IGNORECASE)
-                if month_match:
-                    start_month = months.get(month_match.group(1).lower()[:3], 1)
+            # The month groups capture exactly a three-letter month name (or "present")
+            start_month = self._MONTH_MAP[match.group('start_month').lower()]
+            end_month = self._MONTH_MAP.get(end_part.lower(), 12)
 
-            if isinstance(end_part, str) and 'present' not in end_part.lower():
-                month_match = re.match(r'([a-z]+)', end_part, re.IGNORECASE)
-                if month_match:
-                    end_month = months.get(month_match.group(1).lower()[:3], 12)
+            return start_month, start_year, end_month, end_part, end_year
 
-            return start_month, start_year, end_part, end_year
-
-        return 1, 0, "", None
+        return 1, 0, 12, "", None
 
     def parse(self) -> Dict:
         """Parse resume and return structured data as JSON."""
@@ -587,6 +749,18 @@ def parse_resume(file_path: str) -> Dict:
     return parser.parse()
 
 
+def parse_resumes(file_paths: List[str], workers: Optional[int] = None) -> List[Dict]:
+    """
+    Parse many resume files in parallel worker processes.
+
+    Text extraction and regex matching are CPU-bound and hold the GIL, so
+    files are spread over processes rather than threads. Results are in the
+    order of file_paths; the first file that fails raises its error here.
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(parse_resume, file_paths, chunksize=4))
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python resume_parser.py <resume_file.pdf|resume_file.docx>", file=sys.stderr)
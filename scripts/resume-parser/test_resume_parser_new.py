@@ -3,7 +3,7 @@ import json
 import tempfile
 from pathlib import Path
 import pytest
-from resume_parser import ResumeParser
+from resume_parser import ResumeParser, parse_resume_text
 
 @pytest.fixture
 def create_resume_file():
@@ -64,6 +64,25 @@ JavaScript, React, Angular
         assert 'Python' not in result['skills'] # Should not be extracted from the experience section
         assert 'Java' not in result['skills']
 
+    def test_known_skills_match_on_word_boundaries(self):
+        """Dictionary skills are matched directly, without the free-form fallback."""
+        result = parse_resume_text("Skills: Python, Django and other frameworks")
+
+        assert result['skills'] == ['Django', 'Python']
+
+    def test_education_year_comes_from_education_section(self):
+        """The full 4-digit year is taken from the education text, not later sections."""
+        result = parse_resume_text("""
+Education
+Bachelor of Science in Computer Science
+University of Toronto, 2019
+
+Experience
+Software Engineer, Jan 2020 - Dec 2023
+""")
+
+        assert [entry['year'] for entry in result['education']] == ['2019']
+
     def test_experience_extraction_from_section(self, create_resume_file):
         """Test that experience is extracted correctly from the 'experience' section."""
         resume_content = """
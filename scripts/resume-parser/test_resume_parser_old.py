@@ -0,0 +1,22 @@
+"""
+Unit tests for the legacy resume parser (resume_parser_old.py).
+Run with: python -m pytest test_resume_parser_old.py -v
+"""
+
+from resume_parser_old import ResumeParser
+
+
+class TestResumeParserOld:
+    """Test suite for the legacy Resume Parser."""
+
+    def test_month_year_range_counts_months(self):
+        """'Mon YYYY - Mon YYYY' ranges count whole years plus the month difference."""
+        parser = ResumeParser.from_text("Software Engineer, Jan 2020 - Mar 2021")
+
+        assert parser.extract_experience_months() == 14
+
+    def test_month_year_range_with_earlier_end_month(self):
+        """An end month before the start month borrows from the year difference."""
+        parser = ResumeParser.from_text("Data Analyst\nNov 2019 - Feb 2021\n")
+
+        assert parser.extract_experience_months() == 15